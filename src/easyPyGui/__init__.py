@@ -1,2 +1,38 @@
-from .easyPyGui import *
-__all__ = ["Window","Widget","Label"]
+import importlib
+
+# Public names and the submodule defining each. They are imported on first
+# attribute access, so "import easyPyGui" stays cheap.
+_lazy_attributes = {
+    "Window": ".easyPyGui",
+    "Widget": ".easyPyGui",
+    "widget_types": ".easyPyGui",
+    "Label": ".easyPyGui",
+    "TextField": ".easyPyGui",
+    "TextArea": ".easyPyGui",
+    "Button": ".easyPyGui",
+    "CheckBox": ".easyPyGui",
+    "RadioButton": ".easyPyGui",
+    "ListBox": ".easyPyGui",
+    "Frame": ".easyPyGui",
+    "Slider": ".easyPyGui",
+    "ComboBox": ".easyPyGui",
+    "ProgressBar": ".easyPyGui",
+    "TreeView": ".easyPyGui",
+    "Model": ".reactive",
+    "Observable": ".reactive",
+    "Computed": ".reactive",
+}
+__all__ = ["Window","Widget","Label","Model","Observable","Computed"]
+
+
+def __getattr__(name):
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
@@ -1,6 +1,19 @@
-import tkinter as tk
-from tkinter import ttk
-import config as gv
+import heapq
+import itertools
+import time
+import types
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+# The Tk backend is imported by the first Window (see _load_backend), so
+# building layouts or importing the package does not load tkinter.
+tk = None
+ttk = None
+
+# Namespace holding TABLE_WINDOWS/TABLE_WIDGETS/TABLE_FRAMES, set up on
+# first use by _init_tables.
+gv = None
 
 # Updated widget type mapping with additional items.
 widget_types = {
@@ -18,10 +31,44 @@ widget_types = {
     "TreeView": 12,
 }
 
-# Store in tables using widget_uid as the primary key
-gv.TABLE_WINDOWS = {}
-gv.TABLE_WIDGETS = {}
-gv.TABLE_FRAMES = {}
+
+class _TableRow(dict):
+    """
+    A table row. Rows are owned by their Window/Widget and the tables only
+    hold them weakly, so a row disappears once its owner is freed.
+    """
+
+
+def _init_tables():
+    """
+    Create the widget tables on first use. They live on a top-level
+    'config' module when the application provides one, otherwise on a
+    private namespace.
+    """
+    global gv
+    if gv is not None:
+        return
+    try:
+        import config as tables
+    except ImportError:
+        tables = types.SimpleNamespace()
+    # Store in tables using widget_uid as the primary key
+    tables.TABLE_WINDOWS = weakref.WeakValueDictionary()
+    tables.TABLE_WIDGETS = weakref.WeakValueDictionary()
+    tables.TABLE_FRAMES = weakref.WeakValueDictionary()
+    gv = tables
+
+
+def _load_backend():
+    """
+    Import the Tk backend. Called when the first Window is created.
+    """
+    global tk, ttk
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as tkinter_ttk
+
+        tk, ttk = tkinter, tkinter_ttk
 
 
 class Widget:
@@ -40,6 +87,7 @@ class Widget:
         sticky: str = "N",
         **kwargs,
     ):
+        _init_tables()
         Widget._uid_counter += 1
         self.widget_uid = Widget._uid_counter
 
@@ -57,26 +105,32 @@ class Widget:
         self.extra_arguments = kwargs
         self.parent_root = None  # Window or frame container
         self.root = None  # Tkinter widget instance
+        self.tk_widgets = []  # All Tkinter instances owned by this widget
+        self.variable = None  # Tkinter variable for CheckBox/Radio state
+        self.table = None  # ColumnStore backing a table-mode TreeView
         self.in_frame = False
         self.values = []  # Dynamic values for widget
         self.event = None  # Event placeholder
         self.value = None  # Event-generated value
 
-        gv.TABLE_WIDGETS[self.widget_uid] = {
-            "widget_self": self,  # widget itself, for purposes like variable values
-            "widget_uid": self.widget_uid,
-            "key": self.key,
-            "parent_root": self.parent_root,
-            "self_root": self.parent_root,
-            "widget_type": self.widget_type,
-            "in_frame": self.in_frame,
-            "row": self.row,
-            "column": self.column,
-            "sticky": self.sticky,
-            "extra_arguments": self.extra_arguments,  # not updated to table
-            "event": self.event,
-            "value": self.value,
-        }
+        self._table_row = _TableRow(
+            {
+                "widget_self": self,  # widget itself, for purposes like variable values
+                "widget_uid": self.widget_uid,
+                "key": self.key,
+                "parent_root": self.parent_root,
+                "self_root": self.parent_root,
+                "widget_type": self.widget_type,
+                "in_frame": self.in_frame,
+                "row": self.row,
+                "column": self.column,
+                "sticky": self.sticky,
+                "extra_arguments": self.extra_arguments,  # not updated to table
+                "event": self.event,
+                "value": self.value,
+            }
+        )
+        gv.TABLE_WIDGETS[self.widget_uid] = self._table_row
 
     def __repr__(self):
         return (
@@ -85,6 +139,130 @@ class Widget:
         )
 
 
+class _Timer:
+    """
+    A single scheduled callback. Cancelled timers stay in the heap and are
+    skipped when they come up, until the scheduler compacts the heap.
+    """
+
+    __slots__ = ("name", "interval", "fn", "repeat", "deadline", "cancelled")
+
+    def __init__(self, name, interval, fn, repeat, deadline):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self.repeat = repeat
+        self.deadline = deadline
+        self.cancelled = False
+
+
+class _Scheduler:
+    """
+    Heap-ordered timers for one window. Only a single Tk 'after' is armed,
+    for the earliest deadline, however many timers are registered.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.timers = {}
+        self._heap = []
+        self._cancelled = 0  # Cancelled timers still in the heap
+        self._seq = itertools.count()
+        self._after_id = None
+        self._armed_deadline = None
+
+    def add(self, name, interval, fn, repeat):
+        self.cancel(name)
+        timer = _Timer(name, interval, fn, repeat, time.monotonic() + interval)
+        self.timers[name] = timer
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+        self._arm()
+
+    def cancel(self, name):
+        timer = self.timers.pop(name, None)
+        if timer is not None:
+            timer.cancelled = True
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                # Re-armed timers (debouncing) would otherwise grow the heap
+                # until their old deadlines pass.
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+        return timer is not None
+
+    def stop(self):
+        for timer in self.timers.values():
+            timer.cancelled = True
+        self.timers.clear()
+        self._heap = []
+        self._cancelled = 0
+        self._disarm()
+
+    def _disarm(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._after_id = None
+        self._armed_deadline = None
+
+    def _arm(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+        if not self._heap:
+            self._disarm()
+            return
+        deadline = self._heap[0][0]
+        if deadline == self._armed_deadline:
+            return
+        self._disarm()
+        delay_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        self._after_id = self.root.after(delay_ms, self._run)
+        self._armed_deadline = deadline
+
+    def _run(self):
+        self._after_id = None
+        self._armed_deadline = None
+        now = time.monotonic()
+        due = []
+        # Fire anything due within the next millisecond, as Tk rounds delays.
+        while self._heap and self._heap[0][0] <= now + 0.001:
+            timer = heapq.heappop(self._heap)[2]
+            if timer.cancelled:
+                self._cancelled -= 1
+            else:
+                due.append(timer)
+        for timer in due:
+            if timer.repeat:
+                # Schedule from the previous deadline rather than from now so
+                # the period does not drift; ticks missed while the loop was
+                # busy are skipped instead of fired in a burst.
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    missed = (now - timer.deadline) // timer.interval + 1
+                    timer.deadline += missed * timer.interval
+                heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+            else:
+                self.timers.pop(timer.name, None)
+        # Run every due callback even if one fails; the first error is
+        # re-raised afterwards for Tk to report.
+        error = None
+        for timer in due:
+            if timer.cancelled:
+                continue
+            try:
+                timer.fn()
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        self._arm()
+        if error is not None:
+            raise error
+
+
 class Window:
     """
     A class representing a window in the EasyPyGui framework.
@@ -92,10 +270,14 @@ class Window:
 
     _uid_counter = 1
     _root_instance = None
+    _reading = None  # Window whose read_events is running Tk's event loop
+    pool_limit = 64  # Maximum pooled Tkinter widgets per (type, parent)
 
     def __init__(
         self, title, layout=None, size=(300, 300), resizable=(True, True), hidden=True
     ):
+        _init_tables()
+        _load_backend()
         self.title = title
         self.window_uid = Window._uid_counter
         Window._uid_counter += 1
@@ -114,6 +296,42 @@ class Window:
 
         # Initialize event storage for widget and window events.
         self.last_event = None
+        # Events that must not be overwritten by the next widget event, such
+        # as timer ticks; read_events hands them out one per call.
+        self._pending_events = deque()
+        self._timer_counter = itertools.count(1)
+        self._scheduler = _Scheduler(self.root)
+        self._woken = False
+
+        # Batched widget writes waiting for the next idle pass.
+        self._pending_updates = {}
+        self._batch_depth = 0
+        self._flush_id = None
+
+        # Reactive models (see reactive.Model) fed from read_events.
+        self._models = []
+
+        # Event recording and replay (see recorder.py).
+        self._recorder = None
+        self._replay = None
+
+        # Keys whose value may have changed since the last save_state.
+        self._dirty_keys = set()
+
+        # Suppression of widget callbacks caused by programmatic writes:
+        # a depth counter for synchronous ones and, per key, the value
+        # expected by a callback Tk delivers later.
+        self._applying = 0
+        self._expected_callbacks = {}
+        self._state_log = None
+
+        self._close_requested = False
+        self._unloaded = False
+
+        # Key lookup for widgets placed in this window, and pools of released
+        # Tkinter widgets keyed by (widget class, parent path).
+        self._widgets_by_key = {}
+        self._widget_pool = {}
 
         # Store last window state and size for detecting changes.
         self._last_window_state = self.root.state()
@@ -136,16 +354,7 @@ class Window:
             cols = 0
             for col in row:
                 if col.widget_type == widget_types["Frame"]:
-                    frame_child_uids = self.init_layout(
-                        col.extra_arguments["layout"], parent="frame"
-                    )
-                    gv.TABLE_FRAMES[self.window_uid] = {
-                        "key": col.key,
-                        "frame_uid": col.widget_uid,
-                        "title": self.title,
-                        "window_uid": self.window_uid,
-                        "child_widgets_uids": frame_child_uids,
-                    }
+                    self._register_frame(col)
                     child_uids.append(col.widget_uid)
                 else:
                     cols += 1
@@ -154,13 +363,16 @@ class Window:
                     child_uids.append(col.widget_uid)
         if parent != "window":
             return child_uids
-        gv.TABLE_WINDOWS[self.window_uid] = {
-            "window_self": self,
-            "title": self.title,
-            "window_root": self.root,
-            "window_uid": self.window_uid,
-            "child_widgets_uids": child_uids,
-        }
+        self._table_row = _TableRow(
+            {
+                "window_self": self,
+                "title": self.title,
+                "window_root": self.root,
+                "window_uid": self.window_uid,
+                "child_widgets_uids": child_uids,
+            }
+        )
+        gv.TABLE_WINDOWS[self.window_uid] = self._table_row
         # Assign geometry to widgets
         row_no = 0
         for row in layout:
@@ -181,142 +393,511 @@ class Window:
         for row in layout:
             _cols_no = cols_no
             for col in row:
+                col.parent_root = parent_root
+                col.row = row_no
+                col.column = _cols_no
+                self._widgets_by_key[col.key] = col
                 if col.widget_type == widget_types["Frame"]:
-                    frame = ttk.Frame(parent_root)
+                    frame = self._acquire(ttk.Frame, parent_root)
                     frame.grid(column=_cols_no, row=row_no)
-                    self.create_widget(
-                        col.extra_arguments["layout"], frame, row_no, cols_no
-                    )
+                    col.root = frame
+                    col.tk_widgets = [frame]
+                    # Frame contents are gridded relative to the frame, so
+                    # moving the frame needs no change inside it.
+                    self.create_widget(col.extra_arguments["layout"], frame, 0, 0)
                 else:
-                    gv.TABLE_WIDGETS[col.widget_uid]["parent_root"] = parent_root
+                    col._table_row["parent_root"] = parent_root
+                    col.tk_widgets = []
 
                     # Create widget based on its type with event binding.
                     if col.widget_type == widget_types["Label"]:
-                        widget_instance = ttk.Label(parent_root, **col.extra_arguments)
-                        widget_instance.bind(
-                            "<Button-1>", lambda e, key=col.key: self._handle_event(key)
+                        widget_instance = self._acquire(
+                            ttk.Label, parent_root, **col.extra_arguments
+                        )
+                        self._bind(
+                            widget_instance,
+                            "<Button-1>",
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["Button"]:
                         if "command" not in col.extra_arguments:
-                            widget_instance = ttk.Button(
+                            widget_instance = self._acquire(
+                                ttk.Button,
                                 parent_root,
                                 text=col.extra_arguments.get("text", ""),
-                                command=lambda key=col.key: self._handle_event(key),
+                                command=lambda key=col.key: self._widget_event(key),
                             )
                         else:
                             orig_cmd = col.extra_arguments["command"]
-                            widget_instance = ttk.Button(
+                            widget_instance = self._acquire(
+                                ttk.Button,
                                 parent_root,
                                 text=col.extra_arguments.get("text", ""),
                                 command=lambda key=col.key, orig=orig_cmd: (
                                     orig(),
-                                    self._handle_event(key),
+                                    self._widget_event(key),
                                 ),
                             )
                     elif col.widget_type == widget_types["TextField"]:
-                        widget_instance = ttk.Entry(parent_root, **col.extra_arguments)
-                        widget_instance.bind(
+                        widget_instance = self._acquire(
+                            ttk.Entry, parent_root, **col.extra_arguments
+                        )
+                        self._bind(
+                            widget_instance,
                             "<KeyRelease>",
-                            lambda e, key=col.key: self._handle_event(key),
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["TextArea"]:
-                        widget_instance = tk.Text(parent_root, **col.extra_arguments)
-                        widget_instance.bind(
+                        widget_instance = self._acquire(
+                            tk.Text, parent_root, **col.extra_arguments
+                        )
+                        self._bind(
+                            widget_instance,
                             "<KeyRelease>",
-                            lambda e, key=col.key: self._handle_event(key),
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["ListBox"]:
-                        widget_instance = tk.Listbox(parent_root, **col.extra_arguments)
-                        widget_instance.bind(
+                        options = {
+                            k: v for k, v in col.extra_arguments.items() if k != "items"
+                        }
+                        widget_instance = self._acquire(
+                            tk.Listbox, parent_root, **options
+                        )
+                        widget_instance.insert(
+                            tk.END, *col.extra_arguments.get("items", [])
+                        )
+                        self._bind(
+                            widget_instance,
                             "<<ListboxSelect>>",
-                            lambda e, key=col.key: self._handle_event(key),
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["Radio"]:
                         var = tk.StringVar()
                         var.trace(
-                            "w", lambda *args, key=col.key: self._handle_event(key)
+                            "w", lambda *args, key=col.key: self._widget_event(key)
                         )
+                        col.variable = var
                         options = col.extra_arguments.get("options", [])
                         for idx, option in enumerate(options):
-                            rb = ttk.Radiobutton(
-                                parent_root, text=option, variable=var, value=option
+                            rb = self._acquire(
+                                ttk.Radiobutton,
+                                parent_root,
+                                text=option,
+                                variable=var,
+                                value=option,
                             )
                             rb.grid(column=_cols_no, row=row_no + idx)
+                            col.tk_widgets.append(rb)
                         widget_instance = rb
                     elif col.widget_type == widget_types["CheckBox"]:
+                        options = {
+                            k: v
+                            for k, v in col.extra_arguments.items()
+                            if k not in ("checked", "command")
+                        }
+                        if "variable" not in options:
+                            options["variable"] = tk.BooleanVar(
+                                value=col.extra_arguments.get("checked", False)
+                            )
+                        col.variable = options["variable"]
                         if "command" not in col.extra_arguments:
-                            widget_instance = ttk.Checkbutton(
+                            widget_instance = self._acquire(
+                                ttk.Checkbutton,
                                 parent_root,
-                                **col.extra_arguments,
-                                command=lambda key=col.key: self._handle_event(key),
+                                **options,
+                                command=lambda key=col.key: self._widget_event(key),
                             )
                         else:
                             orig_cmd = col.extra_arguments["command"]
-                            widget_instance = ttk.Checkbutton(
+                            widget_instance = self._acquire(
+                                ttk.Checkbutton,
                                 parent_root,
-                                **col.extra_arguments,
+                                **options,
                                 command=lambda key=col.key, orig=orig_cmd: (
                                     orig(),
-                                    self._handle_event(key),
+                                    self._widget_event(key),
                                 ),
                             )
                     elif col.widget_type == widget_types["Slider"]:
                         if "command" not in col.extra_arguments:
-                            widget_instance = tk.Scale(
+                            widget_instance = self._acquire(
+                                tk.Scale,
                                 parent_root,
                                 **col.extra_arguments,
-                                command=lambda val, key=col.key: self._handle_event(
+                                command=lambda val, key=col.key: self._widget_event(
                                     key
                                 ),
                             )
                         else:
                             orig_cmd = col.extra_arguments["command"]
-                            widget_instance = tk.Scale(
+                            options = {
+                                k: v
+                                for k, v in col.extra_arguments.items()
+                                if k != "command"
+                            }
+                            widget_instance = self._acquire(
+                                tk.Scale,
                                 parent_root,
-                                **col.extra_arguments,
+                                **options,
                                 command=lambda val, key=col.key, orig=orig_cmd: (
                                     orig(val),
-                                    self._handle_event(key),
+                                    self._widget_event(key),
                                 ),
                             )
                     elif col.widget_type == widget_types["ComboBox"]:
-                        widget_instance = ttk.Combobox(
-                            parent_root, **col.extra_arguments
+                        widget_instance = self._acquire(
+                            ttk.Combobox, parent_root, **col.extra_arguments
                         )
-                        widget_instance.bind(
+                        self._bind(
+                            widget_instance,
                             "<<ComboboxSelected>>",
-                            lambda e, key=col.key: self._handle_event(key),
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["ProgressBar"]:
-                        widget_instance = ttk.Progressbar(
-                            parent_root, **col.extra_arguments
+                        widget_instance = self._acquire(
+                            ttk.Progressbar, parent_root, **col.extra_arguments
                         )
-                        widget_instance.bind(
-                            "<Button-1>", lambda e, key=col.key: self._handle_event(key)
+                        self._bind(
+                            widget_instance,
+                            "<Button-1>",
+                            lambda e, key=col.key: self._widget_event(key),
                         )
                     elif col.widget_type == widget_types["TreeView"]:
-                        widget_instance = ttk.Treeview(
-                            parent_root, **col.extra_arguments
+                        options = dict(col.extra_arguments)
+                        if col.table is not None:
+                            options["columns"] = tuple(col.table.names)
+                            options.setdefault("show", "headings")
+                        widget_instance = self._acquire(
+                            ttk.Treeview, parent_root, **options
                         )
-                        widget_instance.bind(
+                        self._bind(
+                            widget_instance,
                             "<<TreeviewSelect>>",
-                            lambda e, key=col.key: self._handle_event(key),
+                            lambda e, key=col.key: self._widget_event(key),
                         )
+                        if col.table is not None:
+                            for name in col.table.names:
+                                widget_instance.heading(
+                                    name,
+                                    text=name,
+                                    command=lambda key=col.key, name=name: (
+                                        self.sort_table(key, name)
+                                    ),
+                                )
+                                # ttk registers heading commands on the parent.
+                                self._track_command(
+                                    widget_instance,
+                                    widget_instance.master,
+                                    widget_instance.heading(name, "command"),
+                                )
+                            widget_instance._easy_items = set()
+                            self._show_table(col, widget_instance)
                     else:
-                        widget_instance = ttk.Label(parent_root, text="Unknown Widget")
+                        widget_instance = self._acquire(
+                            ttk.Label, parent_root, text="Unknown Widget"
+                        )
                     widget_instance.grid(column=_cols_no, row=row_no)
-                    gv.TABLE_WIDGETS[col.widget_uid]["self_root"] = widget_instance
-                    gv.TABLE_WIDGETS[col.widget_uid]["row"] = row_no
-                    gv.TABLE_WIDGETS[col.widget_uid]["column"] = _cols_no
+                    if not col.tk_widgets:
+                        col.tk_widgets = [widget_instance]
+                    col.root = widget_instance
+                    col._table_row["self_root"] = widget_instance
+                    col._table_row["row"] = row_no
+                    col._table_row["column"] = _cols_no
                 _cols_no += 1
             row_no += 1
 
+    def _acquire(self, widget_class, parent_root, **options):
+        """
+        Return a Tkinter widget of 'widget_class' under 'parent_root', reusing
+        a pooled instance released by an earlier remove when one is available.
+        """
+        pool = self._widget_pool.get((widget_class, str(parent_root)))
+        if pool:
+            widget_instance = pool.pop()
+            if options:
+                widget_instance.configure(**options)
+        else:
+            widget_instance = widget_class(parent_root, **options)
+            widget_instance._easy_bindings = []
+            widget_instance._easy_commands = []
+        widget_instance._easy_options = list(options)
+        for option, value in options.items():
+            if callable(value):
+                # Tkinter registered 'value' as a Tcl command; remember its
+                # name so _release can delete it.
+                self._track_command(
+                    widget_instance, widget_instance, widget_instance.cget(option)
+                )
+        return widget_instance
+
+    def _track_command(self, widget_instance, owner, name):
+        """
+        Remember a Tcl command registered on 'owner' for a callback of
+        'widget_instance', to be deleted when the widget is released.
+        """
+        widget_instance._easy_commands.append((owner, str(name)))
+
+    def _bind(self, widget_instance, sequence, func):
+        """
+        Bind 'func' to 'sequence', remembering the binding so it can be
+        dropped when the widget instance is returned to the pool.
+        """
+        funcid = widget_instance.bind(sequence, func)
+        widget_instance._easy_bindings.append((sequence, funcid))
+
+    def _release(self, widget_instance):
+        """
+        Detach a Tkinter widget from the grid and return it to its per-type
+        pool, or destroy it when the pool is already full.
+        """
+        pool = self._widget_pool.setdefault(
+            (type(widget_instance), str(widget_instance.master)), []
+        )
+        if len(pool) >= Window.pool_limit:
+            self._purge_pool(widget_instance)
+            widget_instance.destroy()
+            return
+        widget_instance.grid_forget()
+        for sequence, funcid in widget_instance._easy_bindings:
+            widget_instance.unbind(sequence, funcid)
+        widget_instance._easy_bindings = []
+        # Restore the options set by the previous owner to their defaults.
+        for option in widget_instance._easy_options:
+            try:
+                default = widget_instance.configure(option)[3]
+                widget_instance.configure({option: default})
+            except (tk.TclError, TypeError, IndexError):
+                pass
+        widget_instance._easy_options = []
+        # Tkinter only deletes the Tcl commands it registered for callbacks
+        # when the widget is destroyed, so drop them here.
+        for owner, name in widget_instance._easy_commands:
+            try:
+                owner.deletecommand(name)
+            except tk.TclError:
+                pass
+        widget_instance._easy_commands = []
+        # Clear content that is not held in configuration options.
+        if isinstance(widget_instance, (ttk.Entry, tk.Listbox)):
+            widget_instance.delete(0, tk.END)
+        elif isinstance(widget_instance, tk.Text):
+            widget_instance.delete("1.0", tk.END)
+        elif isinstance(widget_instance, ttk.Treeview):
+            # Reattach rows hidden by a table filter so they are deleted too.
+            items = getattr(widget_instance, "_easy_items", None)
+            if items:
+                widget_instance.set_children("", *items)
+            widget_instance._easy_items = set()
+            widget_instance.delete(*widget_instance.get_children())
+        pool.append(widget_instance)
+
+    def _purge_pool(self, container):
+        """
+        Drop pooled widgets whose parent is 'container' (or one of its
+        descendants), as they are destroyed together with it.
+        """
+        prefix = str(container)
+        for pool_key in list(self._widget_pool):
+            parent = pool_key[1]
+            if parent == prefix or parent.startswith(prefix + "."):
+                del self._widget_pool[pool_key]
+
+    def _release_widget(self, widget):
+        """
+        Release all Tkinter instances of 'widget' (recursing into frames)
+        and drop it from the widget tables.
+        """
+        if widget.widget_type == widget_types["Frame"]:
+            for row in widget.extra_arguments["layout"]:
+                for child in row:
+                    self._release_widget(child)
+            gv.TABLE_FRAMES.pop(widget.widget_uid, None)
+        for widget_instance in widget.tk_widgets:
+            self._release(widget_instance)
+        widget.tk_widgets = []
+        widget.root = None
+        if self._widgets_by_key.get(widget.key) is widget:
+            del self._widgets_by_key[widget.key]
+        gv.TABLE_WIDGETS.pop(widget.widget_uid, None)
+
+    def _register_widgets(self, row, child_uids):
+        """
+        Register the widgets of a newly added layout row, including the
+        contents of any frames it holds.
+        """
+        for col in row:
+            gv.TABLE_WIDGETS[col.widget_uid] = col._table_row
+            if col.widget_type == widget_types["Frame"]:
+                self._register_frame(col)
+            child_uids.append(col.widget_uid)
+
+    def _register_frame(self, frame):
+        frame_child_uids = []
+        for row in frame.extra_arguments["layout"]:
+            for widget in row:
+                widget.in_frame = True
+                widget._table_row["in_frame"] = True
+            self._register_widgets(row, frame_child_uids)
+        frame._frame_row = _TableRow(
+            {
+                "key": frame.key,
+                "frame_uid": frame.widget_uid,
+                "title": self.title,
+                "window_uid": self.window_uid,
+                "child_widgets_uids": frame_child_uids,
+            }
+        )
+        gv.TABLE_FRAMES[frame.widget_uid] = frame._frame_row
+
+    def _locate(self, key, layout=None, parent_root=None, base_row=0):
+        """
+        Find the widget identified by 'key' in the layout tree.
+        Returns (widget, container layout, row index, parent root, base row)
+        or None when the key is not part of this window.
+        """
+        if layout is None:
+            layout, parent_root = self.layout, self.root
+        for row_idx, row in enumerate(layout):
+            for col in row:
+                if col.key == key:
+                    return col, layout, row_idx, parent_root, base_row
+                if col.widget_type == widget_types["Frame"]:
+                    found = self._locate(
+                        key, col.extra_arguments["layout"], col.root, 0
+                    )
+                    if found:
+                        return found
+        return None
+
+    def _container(self, frame_key=None):
+        """
+        Return (layout, parent root, base row, child uid list) for the window
+        itself or for the frame identified by 'frame_key'.
+        """
+        if frame_key is None:
+            return (
+                self.layout,
+                self.root,
+                0,
+                gv.TABLE_WINDOWS[self.window_uid]["child_widgets_uids"],
+            )
+        found = self._locate(frame_key)
+        if found is None or found[0].widget_type != widget_types["Frame"]:
+            raise KeyError(f"No frame with key {frame_key!r}")
+        frame = found[0]
+        return (
+            frame.extra_arguments["layout"],
+            frame.root,
+            0,
+            gv.TABLE_FRAMES[frame.widget_uid]["child_widgets_uids"],
+        )
+
+    def _place(self, widget, row_no, cols_no):
+        """
+        Move an already created widget to a new grid cell.
+        """
+        widget.row = row_no
+        widget.column = cols_no
+        for idx, widget_instance in enumerate(widget.tk_widgets):
+            widget_instance.grid_configure(column=cols_no, row=row_no + idx)
+        widget._table_row["row"] = row_no
+        widget._table_row["column"] = cols_no
+
+    def insert_row(self, row, index=None, frame_key=None):
+        """
+        Insert a layout row at 'index' (default: append) in the window, or
+        in the frame identified by 'frame_key'. Only the rows below the
+        insertion point are moved; existing widgets are not rebuilt.
+        """
+        layout, parent_root, base_row, child_uids = self._container(frame_key)
+        if index is None or index > len(layout):
+            index = len(layout)
+        for row_idx in range(len(layout) - 1, index - 1, -1):
+            for cols_no, col in enumerate(layout[row_idx]):
+                self._place(col, base_row + row_idx + 1, cols_no)
+        layout.insert(index, row)
+        self._register_widgets(row, child_uids)
+        self.create_widget([row], parent_root, base_row + index, 0)
+        if frame_key is None:
+            self.grid_rows = len(layout)
+        self.grid_cols = max(self.grid_cols, len(row))
+
+    def remove(self, key):
+        """
+        Remove the widget identified by 'key'. Widgets to its right move one
+        column left; a row left empty is dropped and the rows below move up.
+        Released Tkinter widgets are kept in a pool for reuse.
+        """
+        found = self._locate(key)
+        if found is None:
+            raise KeyError(f"No widget with key {key!r}")
+        widget, layout, row_idx, parent_root, base_row = found
+        self._release_widget(widget)
+        for uids in [gv.TABLE_WINDOWS[self.window_uid]["child_widgets_uids"]] + [
+            frame["child_widgets_uids"] for frame in gv.TABLE_FRAMES.values()
+        ]:
+            if widget.widget_uid in uids:
+                uids.remove(widget.widget_uid)
+        row = layout[row_idx]
+        cols_no = row.index(widget)
+        del row[cols_no]
+        if row:
+            for shift_col in range(cols_no, len(row)):
+                self._place(row[shift_col], base_row + row_idx, shift_col)
+        else:
+            del layout[row_idx]
+            for shift_row in range(row_idx, len(layout)):
+                for shift_col, col in enumerate(layout[shift_row]):
+                    self._place(col, base_row + shift_row, shift_col)
+            if layout is self.layout:
+                self.grid_rows = len(layout)
+
+    def replace_frame(self, key, layout):
+        """
+        Replace the contents of the frame identified by 'key' with 'layout'.
+        The frame container is kept; its old widgets go back to the pool and
+        are reused by the new layout where the types match.
+        """
+        found = self._locate(key)
+        if found is None or found[0].widget_type != widget_types["Frame"]:
+            raise KeyError(f"No frame with key {key!r}")
+        frame = found[0]
+        for row in frame.extra_arguments["layout"]:
+            for child in row:
+                self._release_widget(child)
+        frame.extra_arguments["layout"] = layout
+        self._register_frame(frame)
+        self.create_widget(layout, frame.root, 0, 0)
+
     def _handle_event(self, key):
         """
         Internal handler to capture widget events.
-        Every interactive widget calls this on user interaction.
+        Every interactive widget reaches this on user interaction.
         """
         self.last_event = key
+        self._dirty_keys.add(key)
+
+    def _widget_event(self, key):
+        """
+        Callback target of all widget bindings. Callbacks caused by the
+        program writing a value (Update, restore_state, a Model push) are
+        dropped, so read_events only reports user interaction.
+        """
+        if self._applying:
+            return  # Fired synchronously, e.g. a Radio variable trace.
+        expected = self._expected_callbacks.pop(key, None)
+        if expected is not None:
+            # Tk runs some callbacks (the Scale -command) at idle time,
+            # after the write returned; drop it if the value is the one
+            # that was written.
+            widget = self._widgets_by_key.get(key)
+            if (
+                widget is not None
+                and widget.root is not None
+                and self._read_value(widget._table_row) == expected
+            ):
+                return
+        self._handle_event(key)
 
     def _on_configure(self, event):
         """
@@ -344,74 +925,396 @@ class Window:
     def _on_exit(self):
         """
         Handle window exit (clicking the close button).
+        The window is unloaded once read_events has delivered "--Exit--"
+        with the final widget values. A window closed while another one is
+        being read is unloaded right away, as nobody may read it again.
         """
         self.last_event = "--Exit--"
-        self.root.destroy()
+        self._close_requested = True
+        if Window._reading is not self:
+            self.root.after_idle(self.unload)
+
+    def _queue_event(self, event):
+        """
+        Queue an event for read_events. An event that is already waiting is
+        not queued twice, so a slow loop does not build up a backlog.
+        """
+        if event not in self._pending_events:
+            self._pending_events.append(event)
+
+    def _wake(self):
+        self._woken = True
+
+    def every(self, interval, fn=None, name=None):
+        """
+        Run 'fn' every 'interval' seconds. Without 'fn', read_events reports
+        "--Timer:<name>--" on each tick instead. Returns the timer name.
+        """
+        return self._add_timer(interval, fn, name, repeat=True)
+
+    def after(self, delay, fn=None, name=None):
+        """
+        Run 'fn' once after 'delay' seconds. Without 'fn', read_events
+        reports "--Timer:<name>--" instead. Returns the timer name.
+        """
+        return self._add_timer(delay, fn, name, repeat=False)
+
+    def cancel_timer(self, name):
+        """
+        Cancel the timer called 'name'. Returns False if there is none.
+        """
+        return self._scheduler.cancel(name)
+
+    def _add_timer(self, interval, fn, name, repeat):
+        if repeat and interval <= 0:
+            raise ValueError("interval must be positive")
+        if name is None:
+            name = f"timer_{next(self._timer_counter)}"
+        if fn is None:
+            event = f"--Timer:{name}--"
+            fn = lambda: self._queue_event(event)
+        self._scheduler.add(name, interval, fn, repeat)
+        return name
+
+    def record(self, path):
+        """
+        Start appending every event returned by read_events, with the
+        values that changed since the previous one, to the file 'path'.
+        """
+        from .recorder import EventRecorder
+
+        self.stop_recording()
+        self._recorder = EventRecorder(path)
+
+    def stop_recording(self):
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def replay(self, path, speed=1.0):
+        """
+        Replay a recording made with record() through read_events, at
+        'speed' times the recorded pace, or as fast as the loop reads
+        events when 'speed' is None. "--ReplayEnd--" is reported once the
+        recording is exhausted. Returns the EventReplay, whose 'events',
+        'elapsed' and 'throughput' attributes measure the run.
+        """
+        from .recorder import EventReplay
+
+        self._replay = EventReplay(self, path, speed)
+        return self._replay
 
     def read_events(self, seconds=0):
+        if self._replay is not None:
+            self._replay.pump()
+        if self._pending_updates and not self._batch_depth:
+            self._flush_updates()
+        reading, Window._reading = Window._reading, self
         try:
             self.root.update_idletasks()
             self.root.update()
+            if seconds and self.last_event is None and not self._pending_events:
+                # Sleep in Tk's event loop until an event arrives or the
+                # timeout expires, instead of returning straight away.
+                self._woken = False
+                wake_id = self.root.after(int(seconds * 1000), self._wake)
+                while (
+                    not self._woken
+                    and self.last_event is None
+                    and not self._pending_events
+                ):
+                    self.root.tk.dooneevent()
+                self.root.after_cancel(wake_id)
         except tk.TclError:
             return None, {}
+        finally:
+            Window._reading = reading
 
-        event = self.last_event
-        self.last_event = None
+        if self.last_event is not None:
+            event = self.last_event
+            self.last_event = None
+        elif self._pending_events:
+            event = self._pending_events.popleft()
+        else:
+            event = None
 
         values = {}
         for widget_uid, widget_data in gv.TABLE_WIDGETS.items():
-            key = widget_data.get("key")
-            widget_instance = widget_data.get("self_root")
-            if widget_instance is None:
+            if widget_data.get("self_root") is None:
                 continue
+            values[widget_data.get("key")] = self._read_value(widget_data)
 
-            try:
-                wtype = widget_data.get("widget_type")
-                if wtype == widget_types["TextField"]:
-                    values[key] = widget_instance.get()
-                elif wtype == widget_types["TextArea"]:
-                    values[key] = widget_instance.get("1.0", tk.END).strip()
-                elif wtype == widget_types["ComboBox"]:
-                    current = widget_instance.get()
-                    options = widget_instance.cget("values")
-                    try:
-                        values[key] = options.index(current)
-                    except ValueError:
-                        values[key] = None
-                elif wtype == widget_types["Slider"]:
-                    values[key] = widget_instance.get()
-                elif wtype == widget_types["ListBox"]:
-                    selection = widget_instance.curselection()
-                    values[key] = selection
-                elif wtype in (widget_types["CheckBox"], widget_types["Radio"]):
-                    values[key] = None  # Extend as needed.
-                elif wtype == widget_types["TreeView"]:
-                    values[key] = widget_instance.selection()
-                else:
-                    values[key] = ""
-            except tk.TclError:
-                # Widget has likely been destroyed; handle gracefully.
-                values[key] = None
-
+        for model in self._models:
+            model.sync(values)
+        if self._recorder is not None and event is not None:
+            self._recorder.write(event, values)
+        if self._close_requested:
+            self.unload()
         return event, values
 
+    def _read_value(self, widget_data):
+        """
+        Return the current value of a widget as reported by read_events.
+        """
+        widget_instance = widget_data.get("self_root")
+        try:
+            wtype = widget_data.get("widget_type")
+            if wtype == widget_types["TextField"]:
+                return widget_instance.get()
+            elif wtype == widget_types["TextArea"]:
+                return widget_instance.get("1.0", tk.END).strip()
+            elif wtype == widget_types["ComboBox"]:
+                current = widget_instance.get()
+                options = widget_instance.cget("values")
+                try:
+                    return options.index(current)
+                except ValueError:
+                    return None
+            elif wtype == widget_types["Slider"]:
+                return widget_instance.get()
+            elif wtype == widget_types["ListBox"]:
+                return widget_instance.curselection()
+            elif wtype in (widget_types["CheckBox"], widget_types["Radio"]):
+                variable = widget_data["widget_self"].variable
+                return variable.get() if variable is not None else None
+            elif wtype == widget_types["TreeView"]:
+                selection = widget_instance.selection()
+                if widget_data["widget_self"].table is not None:
+                    # Table rows are reported by their stable row id.
+                    return tuple(int(iid) for iid in selection)
+                return selection
+            elif wtype == widget_types["ProgressBar"]:
+                return float(widget_instance.cget("value"))
+            else:
+                return ""
+        except tk.TclError:
+            # Widget has likely been destroyed; handle gracefully.
+            return None
+
+    def save_state(self, path):
+        """
+        Save widget values to 'path' as an append-only log. The first save
+        writes every value; later saves append only the values changed
+        since, so calling this from a timer, e.g.
+        win.every(1, lambda: win.save_state(path)), stays cheap.
+        """
+        from .session import StateLog
+
+        new_log = self._state_log is None or self._state_log.path != path
+        if new_log:
+            if self._state_log is not None:
+                self._state_log.close()
+            self._state_log = StateLog(path)
+            keys = list(self._widgets_by_key)
+        else:
+            keys = self._dirty_keys
+        changes = {}
+        saved = self._state_log.state
+        for key in keys:
+            widget = self._widgets_by_key.get(key)
+            if widget is None or widget.root is None:
+                continue
+            value = self._read_value(widget._table_row)
+            if isinstance(value, tuple):
+                value = list(value)  # Compare in the form JSON gives back.
+            if key not in saved or saved[key] != value:
+                changes[key] = value
+        self._dirty_keys.clear()
+        if new_log:
+            # A new log starts from the full state rather than appending to
+            # whatever an earlier session left in the file.
+            self._state_log.state = changes
+            self._state_log.compact()
+        else:
+            self._state_log.append(changes)
+
+    def restore_state(self, path):
+        """
+        Restore widget values saved with save_state, applying them in one
+        batch. Later save_state calls to the same path append to the log.
+        """
+        from .session import StateLog
+
+        if self._state_log is not None:
+            self._state_log.close()
+        self._state_log = StateLog(path)
+        state = self._state_log.load()
+        with self.batch():
+            for key, value in state.items():
+                self._restore_value(key, value)
+        self._dirty_keys.clear()
+        return state
+
+    def _value_of(self, key):
+        """
+        Return the value of one widget as reported by read_events.
+        """
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.root is None:
+            return None
+        return self._read_value(widget._table_row)
+
+    def _restore_value(self, key, value):
+        """
+        Write back a value in the form read_events reported it, e.g. a
+        ListBox or TreeView selection rather than its items.
+        """
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.root is None:
+            return
+        if widget.widget_type not in (
+            widget_types["ListBox"],
+            widget_types["TreeView"],
+        ):
+            # Update suppresses the callbacks its own write causes.
+            self.Update(key, value)
+            return
+        if self._read_value(widget._table_row) == tuple(value):
+            return
+        widget_instance = widget.root
+        self._applying += 1
+        try:
+            if widget.widget_type == widget_types["ListBox"]:
+                widget_instance.selection_clear(0, tk.END)
+                for index in value:
+                    widget_instance.selection_set(index)
+            else:
+                if widget.table is not None:
+                    value = [widget.table.iids[row_id] for row_id in value]
+                widget_instance.selection_set(value)
+                # <<TreeviewSelect>> is delivered later, from the event queue.
+                self._expected_callbacks[key] = self._read_value(widget._table_row)
+        finally:
+            self._applying -= 1
+        self._dirty_keys.add(key)
+
     def Update(self, key, value):
         """
         Update the widget identified by 'key' with the given 'value'.
-        Currently supports TextField and TextArea.
+        Supports TextField, TextArea, CheckBox, Radio, Slider, ComboBox,
+        ListBox and ProgressBar. Inside 'with win.batch():' the write is
+        deferred and applied together with the others.
         """
-        for widget_uid, widget_data in gv.TABLE_WIDGETS.items():
-            if widget_data.get("key") == key:
-                widget_instance = widget_data.get("self_root")
-                if widget_instance is None:
-                    break
-                if widget_data.get("widget_type") == widget_types["TextField"]:
-                    widget_instance.delete(0, tk.END)
-                    widget_instance.insert(0, value)
-                elif widget_data.get("widget_type") == widget_types["TextArea"]:
-                    widget_instance.delete("1.0", tk.END)
-                    widget_instance.insert("1.0", value)
-                break
+        if self._batch_depth:
+            self._pending_updates[key] = value
+        else:
+            self._apply_update(key, value)
+
+    def update_many(self, updates):
+        """
+        Update several widgets from a {key: value} dict in one idle pass.
+        Later writes to the same key replace earlier ones.
+        """
+        self._pending_updates.update(updates)
+        if not self._batch_depth:
+            self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect Update/set calls made inside the block and apply them in a
+        single idle pass when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._pending_updates and self._flush_id is None and not self._unloaded:
+            self._flush_id = self.root.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        """
+        Apply all pending batched updates now.
+        """
+        if self._flush_id is not None:
+            try:
+                self.root.after_cancel(self._flush_id)
+            except tk.TclError:
+                pass
+            self._flush_id = None
+        pending, self._pending_updates = self._pending_updates, {}
+        for key, value in pending.items():
+            self._apply_update(key, value)
+
+    def _apply_update(self, key, value):
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.root is None:
+            return
+        # Skip writes that would not change anything.
+        if self._written_form(widget, value) == value:
+            return
+        self._dirty_keys.add(key)
+        self._applying += 1
+        try:
+            self._write_value(widget, value)
+        finally:
+            self._applying -= 1
+        if widget.widget_type == widget_types["Slider"]:
+            self._expected_callbacks[key] = self._read_value(widget._table_row)
+
+    def _write_value(self, widget, value):
+        widget_instance = widget.root
+        wtype = widget.widget_type
+        if wtype == widget_types["TextField"]:
+            widget_instance.delete(0, tk.END)
+            widget_instance.insert(0, value)
+        elif wtype == widget_types["TextArea"]:
+            widget_instance.delete("1.0", tk.END)
+            widget_instance.insert("1.0", value)
+        elif wtype in (widget_types["CheckBox"], widget_types["Radio"]):
+            if widget.variable is not None:
+                widget.variable.set(value)
+        elif wtype == widget_types["Slider"]:
+            widget_instance.set(value)
+        elif wtype == widget_types["ComboBox"]:
+            # An index selects an option, None clears the selection, a list
+            # replaces the options and anything else is shown as the text.
+            if isinstance(value, int):
+                widget_instance.current(value)
+            elif value is None:
+                widget_instance.set("")
+            elif isinstance(value, (list, tuple)):
+                widget_instance.configure(values=value)
+            else:
+                widget_instance.set(value)
+        elif wtype == widget_types["ListBox"]:
+            # An index selects an item, a list replaces the items.
+            if isinstance(value, int):
+                widget_instance.selection_clear(0, tk.END)
+                widget_instance.selection_set(value)
+            else:
+                widget_instance.delete(0, tk.END)
+                widget_instance.insert(tk.END, *value)
+        elif wtype == widget_types["ProgressBar"]:
+            widget_instance.configure(value=value)
+
+    def _written_form(self, widget, value):
+        """
+        Return the widget's current state in the form _apply_update would
+        write 'value', so an unchanged write can be detected.
+        """
+        widget_instance = widget.root
+        wtype = widget.widget_type
+        try:
+            if wtype == widget_types["ComboBox"]:
+                if value is None or isinstance(value, int):
+                    return self._read_value(widget._table_row)
+                elif isinstance(value, (list, tuple)):
+                    return type(value)(widget_instance.cget("values"))
+                return widget_instance.get()
+            elif wtype == widget_types["ListBox"]:
+                if isinstance(value, int):
+                    selection = widget_instance.curselection()
+                    return selection[0] if len(selection) == 1 else None
+                return type(value)(widget_instance.get(0, tk.END))
+        except (tk.TclError, TypeError, ValueError):
+            return None
+        return self._read_value(widget._table_row)
 
     def set(self, key, value):
         """
@@ -426,26 +1329,135 @@ class Window:
         For ComboBox it returns the list of options.
         For Slider it returns its current value.
         """
-        for widget_uid, widget_data in gv.TABLE_WIDGETS.items():
-            if widget_data.get("key") == key:
-                widget_instance = widget_data.get("self_root")
-                if widget_instance is None:
-                    break
-                wtype = widget_data.get("widget_type")
-                if wtype == widget_types["TextField"]:
-                    return widget_instance.get()
-                elif wtype == widget_types["TextArea"]:
-                    return widget_instance.get("1.0", tk.END).strip()
-                elif wtype == widget_types["ComboBox"]:
-                    return widget_instance.cget("values")
-                elif wtype == widget_types["Slider"]:
-                    return widget_instance.get()
+        if self._pending_updates and not self._batch_depth:
+            self._flush_updates()
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.root is None:
+            return None
+        widget_instance = widget.root
+        wtype = widget.widget_type
+        if wtype == widget_types["TextField"]:
+            return widget_instance.get()
+        elif wtype == widget_types["TextArea"]:
+            return widget_instance.get("1.0", tk.END).strip()
+        elif wtype == widget_types["ComboBox"]:
+            return widget_instance.cget("values")
+        elif wtype == widget_types["Slider"]:
+            return widget_instance.get()
         return None
 
+    def sort_table(self, key, column, descending=None):
+        """
+        Sort the table-mode TreeView 'key' by 'column'. Without
+        'descending', sorting the same column again reverses the order.
+        """
+        widget = self._table_widget(key)
+        table = widget.table
+        if descending is None:
+            descending = table.sort_column == column and not table.descending
+        table.set_sort(column, descending)
+        self._show_table(widget, widget.root)
+
+    def filter_table(self, key, mask):
+        """
+        Show only the rows of the table-mode TreeView 'key' selected by
+        'mask' (see ColumnStore.set_filter); None shows all rows again.
+        """
+        widget = self._table_widget(key)
+        widget.table.set_filter(mask)
+        self._show_table(widget, widget.root)
+
+    def _table_widget(self, key):
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.table is None:
+            raise KeyError(f"No table-mode TreeView with key {key!r}")
+        return widget
+
+    def _show_table(self, widget, tree):
+        """
+        Push the current row order of a table-mode TreeView to Tk. Rows are
+        inserted the first time they become visible; after that sorting and
+        filtering only reorder them, in a single call.
+        """
+        table = widget.table
+        order = table.view()
+        created = tree._easy_items
+        iids = table.iids
+        for row_id in order:
+            iid = iids[row_id]
+            if iid not in created:
+                tree.insert("", tk.END, iid=iid, values=table.row(row_id))
+                created.add(iid)
+        tree.set_children("", *[iids[row_id] for row_id in order])
+
     def show(self):
+        if self._unloaded:
+            return
         self.root.deiconify()
         self.hidden = False
 
+    def hide(self):
+        """
+        Withdraw the window from the screen without destroying it.
+        """
+        if self._unloaded:
+            return
+        self.root.withdraw()
+        self.hidden = True
+
+    def unload(self):
+        """
+        Destroy the window and drop all of its entries from TABLE_WINDOWS,
+        TABLE_WIDGETS and TABLE_FRAMES. Unloading the root window also
+        unloads every other window, as Tk destroys them with it.
+        Calling unload more than once is harmless.
+        """
+        if self._unloaded:
+            return
+        self._unloaded = True
+        self._close_requested = False
+        for row in self.layout:
+            for col in row:
+                self._forget_widget(col)
+        gv.TABLE_WINDOWS.pop(self.window_uid, None)
+        self._widgets_by_key.clear()
+        self._widget_pool.clear()
+        self._scheduler.stop()
+        self._pending_events.clear()
+        self._pending_updates.clear()
+        self._flush_id = None
+        self._models.clear()
+        self.stop_recording()
+        self._replay = None
+        if self._state_log is not None:
+            self._state_log.close()
+            self._state_log = None
+        if self.root is Window._root_instance:
+            for window_data in list(gv.TABLE_WINDOWS.values()):
+                window_data["window_self"].unload()
+            Window._root_instance = None
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass
+
+    def _forget_widget(self, widget):
+        """
+        Drop 'widget' (and the contents of frames) from the tables and
+        release its references to Tkinter instances.
+        """
+        if widget.widget_type == widget_types["Frame"]:
+            for row in widget.extra_arguments["layout"]:
+                for child in row:
+                    self._forget_widget(child)
+            gv.TABLE_FRAMES.pop(widget.widget_uid, None)
+        gv.TABLE_WIDGETS.pop(widget.widget_uid, None)
+        widget._table_row["parent_root"] = None
+        widget._table_row["self_root"] = None
+        widget.tk_widgets = []
+        widget.root = None
+        widget.parent_root = None
+
 
 # Existing widget factory functions.
 def Label(text, key=None, **kwargs):
@@ -515,8 +1527,16 @@ def ProgressBar(key=None, **kwargs):
     return Widget("ProgressBar", key=key, **kwargs)
 
 
-def TreeView(key=None, **kwargs):
+def TreeView(key=None, data=None, **kwargs):
     """
     Create a tree view widget.
+    With 'data', a {column name: values} dict, the tree view shows a table
+    that is sorted by clicking a header and filtered with
+    Window.filter_table; read_events reports selected rows by row id.
     """
-    return Widget("TreeView", key=key, **kwargs)
+    widget = Widget("TreeView", key=key, **kwargs)
+    if data is not None:
+        from .table import ColumnStore
+
+        widget.table = ColumnStore(data)
+    return widget
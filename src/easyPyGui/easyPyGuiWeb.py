@@ -0,0 +1,784 @@
+import asyncio
+import base64
+import hashlib
+import ipaddress
+import itertools
+import json
+import queue
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+from .easyPyGui import _init_tables, _Scheduler, widget_types
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_type_names = {number: name for name, number in widget_types.items()}
+
+
+class _MainLoopTimer:
+    """
+    Stands in for the Tk root of a _Scheduler. The scheduler keeps at most
+    one 'after' armed, which read_events runs on the application thread.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._ids = 0
+
+    def after(self, ms, func):
+        self._ids += 1
+        self._pending[self._ids] = (time.monotonic() + ms / 1000, func)
+        return self._ids
+
+    def after_cancel(self, after_id):
+        self._pending.pop(after_id, None)
+
+    def next_due(self):
+        return min((due for due, func in self._pending.values()), default=None)
+
+    def run_due(self):
+        now = time.monotonic()
+        for after_id, (due, func) in list(self._pending.items()):
+            if due <= now and self._pending.pop(after_id, None) is not None:
+                func()
+
+
+class Window:
+    """
+    A window served to web browsers instead of drawn with Tk. It takes the
+    same layouts and offers the same read_events/Update API as
+    easyPyGui.Window. A local HTTP + WebSocket server (stdlib only) serves
+    the page. All connected browsers share the window's values: changes
+    are sent as per-key deltas at most once per frame, encoded once for
+    every client, and browser input arrives as events from read_events.
+    """
+
+    _uid_counter = 1
+
+    def __init__(
+        self,
+        title,
+        layout=None,
+        size=(300, 300),
+        resizable=(True, True),
+        hidden=True,
+        host="127.0.0.1",
+        port=8765,
+        frame_rate=30,
+    ):
+        _init_tables()
+        self.title = title
+        self.window_uid = Window._uid_counter
+        Window._uid_counter += 1
+        self.layout = layout if layout else []
+        self.size = size
+        self.hidden = hidden
+        self._page_hidden = False  # Set by hide(), like withdrawing a Tk window
+        self.frame_interval = 1 / frame_rate
+
+        self._widgets_by_key = {}
+        self._values = {}
+        self._options = {}  # ComboBox options and ListBox items
+        self._index_layout(self.layout)
+        self._layout_description = self._describe(self.layout)
+
+        self._events = queue.Queue()
+        self._models = []  # Reactive models attached to this window
+        self._timer_counter = itertools.count(1)
+        self._timer_root = _MainLoopTimer()
+        self._scheduler = _Scheduler(self._timer_root)
+
+        # Changes waiting for the next frame, guarded by _lock as browser
+        # input arrives on the server thread.
+        self._lock = threading.Lock()
+        self._dirty_values = {}
+        self._dirty_options = {}
+        self._batch_depth = 0
+        self._unloaded = False
+
+        self._clients = set()
+        self._flush_handle = None
+        self._flush_requested = False
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._serve, args=(host, port, started), daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        if self._server_error is not None:
+            raise self._server_error
+
+    @property
+    def url(self):
+        return f"http://{self.address[0]}:{self.address[1]}/"
+
+    def _index_layout(self, layout):
+        for row in layout:
+            for col in row:
+                self._widgets_by_key[col.key] = col
+                if col.widget_type == widget_types["Frame"]:
+                    self._index_layout(col.extra_arguments["layout"])
+                    continue
+                self._values[col.key] = self._initial_value(col)
+                if col.widget_type == widget_types["ComboBox"]:
+                    self._options[col.key] = list(col.extra_arguments.get("values", []))
+                elif col.widget_type == widget_types["ListBox"]:
+                    self._options[col.key] = list(col.extra_arguments.get("items", []))
+
+    @staticmethod
+    def _initial_value(widget):
+        wtype = widget.widget_type
+        arguments = widget.extra_arguments
+        if wtype in (widget_types["TextField"], widget_types["TextArea"]):
+            return arguments.get("text", "")
+        elif wtype == widget_types["CheckBox"]:
+            return bool(arguments.get("checked", False))
+        elif wtype == widget_types["Slider"]:
+            return arguments.get("from_", 0)
+        elif wtype == widget_types["ComboBox"]:
+            return None
+        elif wtype in (widget_types["ListBox"], widget_types["TreeView"]):
+            return ()
+        elif wtype == widget_types["ProgressBar"]:
+            return arguments.get("value", 0)
+        return ""
+
+    def _describe(self, layout):
+        """
+        The layout as sent to the browser.
+        """
+        rows = []
+        for row in layout:
+            cells = []
+            for col in row:
+                arguments = col.extra_arguments
+                cell = {"k": col.key, "t": _type_names[col.widget_type]}
+                if "text" in arguments:
+                    cell["text"] = arguments["text"]
+                if col.widget_type == widget_types["Frame"]:
+                    cell["layout"] = self._describe(arguments["layout"])
+                elif col.widget_type == widget_types["Radio"]:
+                    cell["options"] = list(arguments.get("options", []))
+                elif col.widget_type == widget_types["Slider"]:
+                    cell["from"] = arguments.get("from_", 0)
+                    cell["to"] = arguments.get("to", 100)
+                elif col.widget_type == widget_types["ProgressBar"]:
+                    cell["max"] = arguments.get("maximum", 100)
+                elif (
+                    col.widget_type == widget_types["TreeView"]
+                    and col.table is not None
+                ):
+                    table = col.table
+                    cell["columns"] = table.names
+                    cell["rows"] = [
+                        [int(row_id)] + list(table.row(row_id))
+                        for row_id in table.view()
+                    ]
+                cells.append(cell)
+            rows.append(cells)
+        return rows
+
+    # Server thread -----------------------------------------------------
+
+    def _serve(self, host, port, started):
+        asyncio.set_event_loop(self._loop)
+        self._server_error = None
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, host, port)
+            )
+            self.address = self._server.sockets[0].getsockname()[:2]
+            self._allowed_hosts = self._served_hosts()
+        except OSError as error:
+            self._server_error = error
+            started.set()
+            return
+        started.set()
+        self._loop.run_forever()
+        # Shut down: stop listening, disconnect the browsers and let their
+        # handlers finish before closing the loop.
+        self._server.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            await self._handle_request(reader, writer)
+        except (
+            asyncio.CancelledError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ConnectionError,
+            ValueError,
+        ):
+            pass  # The browser went away, sent garbage, or we are unloading.
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _handle_request(self, reader, writer):
+        request = await reader.readuntil(b"\r\n\r\n")
+        lines = request.decode("latin-1").split("\r\n")
+        request_line = lines[0].split(" ")
+        path = request_line[1] if len(request_line) > 1 else "/"
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("host") not in self._allowed_hosts:
+            # A page on another name that resolves here (DNS rebinding)
+            # must not reach the window.
+            writer.write(
+                b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            await writer.drain()
+        elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+            await self._handle_websocket(reader, writer, headers)
+        elif path == "/":
+            body = _PAGE.replace("{title}", _html_escape(self.title)).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n" % len(body) + body
+            )
+            await writer.drain()
+        else:
+            writer.write(
+                b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            await writer.drain()
+
+    async def _handle_websocket(self, reader, writer, headers):
+        if not self._origin_allowed(headers):
+            # Another site's page must not drive the window from a browser
+            # that can reach this server.
+            writer.write(
+                b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            await writer.drain()
+            return
+        digest = hashlib.sha1(
+            (headers.get("sec-websocket-key", "") + _WEBSOCKET_GUID).encode()
+        ).digest()
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+            b"Connection: Upgrade\r\nSec-WebSocket-Accept: "
+            + base64.b64encode(digest)
+            + b"\r\n\r\n"
+        )
+        with self._lock:
+            snapshot = {
+                "title": self.title,
+                "layout": self._layout_description,
+                "v": self._values,
+                "o": self._options,
+                "h": self._page_hidden,
+            }
+            # Sent under the lock so no delta can slip in before it.
+            writer.write(_encode_frame(_dumps(snapshot)))
+            self._clients.add(writer)
+        while True:
+            opcode, payload = await _read_frame(reader)
+            if opcode == 0x1:
+                self._on_message(payload)
+            elif opcode == 0x8:
+                writer.write(_encode_frame(b"", opcode=0x8))
+                return
+            elif opcode == 0x9:
+                writer.write(_encode_frame(payload, opcode=0xA))
+
+    def _served_hosts(self):
+        """
+        The Host header values this server answers to: its bound address,
+        plus localhost when bound to loopback. Bind to a specific address
+        to serve other machines.
+        """
+        host, port = self.address
+        names = [f"[{host}]" if ":" in host else host]
+        try:
+            if ipaddress.ip_address(host).is_loopback:
+                names.append("localhost")
+        except ValueError:
+            pass
+        return {f"{name}:{port}" for name in names}
+
+    def _origin_allowed(self, headers):
+        """
+        Browsers send the Origin of the page opening a WebSocket; it must
+        be a page served here. Clients that send no Origin are not
+        browsers and are let through.
+        """
+        origin = headers.get("origin")
+        if origin is None:
+            return True
+        return origin in {f"http://{host}" for host in self._allowed_hosts}
+
+    def _on_message(self, payload):
+        """
+        Apply a browser message {"e": event, "v": {key: value}}. Messages
+        of the wrong shape are dropped, as are values a widget cannot hold.
+        """
+        message = json.loads(payload)
+        if not isinstance(message, dict):
+            return
+        values = message.get("v", {})
+        event = message.get("e")
+        if not isinstance(values, dict) or not isinstance(event, (str, type(None))):
+            return
+        changes = {}
+        for key, value in values.items():
+            widget = self._widgets_by_key.get(key)
+            if widget is None or not self._accepts(widget, value):
+                continue
+            if widget.widget_type in (widget_types["ListBox"], widget_types["TreeView"]):
+                value = tuple(value)
+            changes[key] = value
+        with self._lock:
+            self._values.update(changes)
+            # Other browsers showing the window get the change next frame.
+            self._dirty_values.update(changes)
+        if changes:
+            self._schedule_flush()
+        if event is not None and event in self._widgets_by_key:
+            self._events.put(event)
+
+    def _accepts(self, widget, value):
+        """
+        Whether 'value' from a browser is a valid value for 'widget'.
+        """
+        wtype = widget.widget_type
+        if wtype in (widget_types["TextField"], widget_types["TextArea"]):
+            return isinstance(value, str)
+        elif wtype == widget_types["Radio"]:
+            return value in widget.extra_arguments.get("options", [])
+        elif wtype == widget_types["CheckBox"]:
+            return isinstance(value, bool)
+        elif wtype == widget_types["Slider"]:
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        elif wtype == widget_types["ComboBox"]:
+            return value is None or _is_index(value, len(self._options[widget.key]))
+        elif wtype == widget_types["ListBox"]:
+            count = len(self._options[widget.key])
+            return isinstance(value, list) and all(_is_index(i, count) for i in value)
+        elif wtype == widget_types["TreeView"]:
+            count = len(widget.table) if widget.table is not None else 0
+            return isinstance(value, list) and all(_is_index(i, count) for i in value)
+        return False  # Buttons, labels and progress bars take no input.
+
+    def _schedule_flush(self):
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.frame_interval, self._flush
+            )
+
+    def _flush(self):
+        """
+        Send the changes of the last frame to every browser, encoding the
+        message once. Browsers too far behind are dropped rather than
+        buffered without limit.
+        """
+        self._flush_handle = None
+        # Cleared before taking the changes, so a write that misses this
+        # frame requests the next one.
+        self._flush_requested = False
+        with self._lock:
+            if not self._dirty_values and not self._dirty_options:
+                return
+            message = {}
+            if self._dirty_values:
+                message["v"] = self._dirty_values
+            if self._dirty_options:
+                message["o"] = self._dirty_options
+            self._dirty_values = {}
+            self._dirty_options = {}
+        frame = _encode_frame(_dumps(message))
+        for writer in list(self._clients):
+            if writer.transport.get_write_buffer_size() > 1 << 20:
+                self._clients.discard(writer)
+                writer.close()
+            else:
+                writer.write(frame)
+
+    def _send(self, message):
+        frame = _encode_frame(_dumps(message))
+        for writer in list(self._clients):
+            writer.write(frame)
+
+    def _request_flush(self):
+        if not self._unloaded and not self._flush_requested:
+            self._flush_requested = True
+            self._loop.call_soon_threadsafe(self._schedule_flush)
+
+    # Application thread -------------------------------------------------
+
+    def _queue_event(self, event):
+        self._events.put(event)
+
+    def every(self, interval, fn=None, name=None):
+        """
+        Run 'fn' every 'interval' seconds. Without 'fn', read_events reports
+        "--Timer:<name>--" on each tick instead. Returns the timer name.
+        """
+        return self._add_timer(interval, fn, name, repeat=True)
+
+    def after(self, delay, fn=None, name=None):
+        """
+        Run 'fn' once after 'delay' seconds. Without 'fn', read_events
+        reports "--Timer:<name>--" instead. Returns the timer name.
+        """
+        return self._add_timer(delay, fn, name, repeat=False)
+
+    def cancel_timer(self, name):
+        return self._scheduler.cancel(name)
+
+    def _add_timer(self, interval, fn, name, repeat):
+        if repeat and interval <= 0:
+            raise ValueError("interval must be positive")
+        if name is None:
+            name = f"timer_{next(self._timer_counter)}"
+        if fn is None:
+            event = f"--Timer:{name}--"
+            fn = lambda: self._queue_event(event)
+        self._scheduler.add(name, interval, fn, repeat)
+        return name
+
+    def read_events(self, seconds=0):
+        """
+        Wait up to 'seconds' for a browser event or timer and return
+        (event, values) like easyPyGui.Window.read_events. Timer callbacks
+        run here, on the calling thread.
+        """
+        if self._unloaded:
+            return None, {}
+        deadline = time.monotonic() + seconds
+        event = None
+        while True:
+            self._timer_root.run_due()
+            try:
+                event = self._events.get_nowait()
+                break
+            except queue.Empty:
+                pass
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            timeout = deadline - now
+            next_due = self._timer_root.next_due()
+            if next_due is not None:
+                timeout = min(timeout, max(0, next_due - now))
+            try:
+                event = self._events.get(timeout=timeout)
+                break
+            except queue.Empty:
+                continue
+        with self._lock:
+            values = dict(self._values)
+        for model in self._models:
+            model.sync(values)
+        return event, values
+
+    def Update(self, key, value):
+        """
+        Update the widget identified by 'key' with the given 'value', in
+        the forms easyPyGui.Window.Update accepts. Browsers receive the
+        change with the next frame.
+        """
+        widget = self._widgets_by_key.get(key)
+        if widget is None or widget.widget_type == widget_types["Frame"]:
+            return
+        wtype = widget.widget_type
+        options = None
+        # As in easyPyGui.Window: a ComboBox takes an index, a list of
+        # options or an option text; a ListBox an index or a list of items.
+        if wtype == widget_types["ComboBox"]:
+            if isinstance(value, (list, tuple)):
+                options = list(value)
+            elif not isinstance(value, int):
+                value = (
+                    self._options[key].index(value)
+                    if value in self._options[key]
+                    else None
+                )
+        elif wtype == widget_types["ListBox"]:
+            if isinstance(value, int):
+                value = (value,)
+            else:
+                options = list(value)
+        with self._lock:
+            if options is not None:
+                if self._options.get(key) == options:
+                    return
+                self._options[key] = options
+                self._dirty_options[key] = options
+            else:
+                if self._values.get(key) == value:
+                    return
+                self._values[key] = value
+                self._dirty_values[key] = value
+        if not self._batch_depth:
+            self._request_flush()
+
+    def set(self, key, value):
+        """
+        Alias for Update. Allows external code to set widget values.
+        """
+        self.Update(key, value)
+
+    def update_many(self, updates):
+        """
+        Update several widgets from a {key: value} dict, sent to the
+        browsers in one frame.
+        """
+        with self.batch():
+            for key, value in updates.items():
+                self.Update(key, value)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect Update/set calls made inside the block and send them in a
+        single frame when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._request_flush()
+
+    def _value_of(self, key):
+        with self._lock:
+            return self._values.get(key)
+
+    def _restore_value(self, key, value):
+        """
+        Write back a value in the form read_events reported it, e.g. a
+        ListBox or TreeView selection rather than its items.
+        """
+        widget = self._widgets_by_key.get(key)
+        if widget is None or key not in self._values:
+            return
+        if widget.widget_type in (widget_types["ListBox"], widget_types["TreeView"]):
+            value = tuple(value)
+        with self._lock:
+            if self._values[key] == value:
+                return
+            self._values[key] = value
+            self._dirty_values[key] = value
+        if not self._batch_depth:
+            self._request_flush()
+
+    def get(self, key):
+        """
+        Retrieve the widget content or configuration based on its type.
+        For ComboBox it returns the list of options.
+        """
+        widget = self._widgets_by_key.get(key)
+        if widget is None:
+            return None
+        with self._lock:
+            if widget.widget_type == widget_types["ComboBox"]:
+                return tuple(self._options[key])
+            return self._values.get(key)
+
+    def show(self):
+        self._set_hidden(False)
+
+    def hide(self):
+        self._set_hidden(True)
+
+    def _set_hidden(self, hidden):
+        self.hidden = hidden
+        if self._unloaded or hidden == self._page_hidden:
+            return
+        self._page_hidden = hidden
+        self._loop.call_soon_threadsafe(self._send, {"h": hidden})
+
+    def unload(self):
+        """
+        Stop the server, disconnect the browsers and drop the window's
+        widgets from the tables. Calling unload more than once is harmless.
+        """
+        if self._unloaded:
+            return
+        self._unloaded = True
+        self._scheduler.stop()
+        self._models.clear()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        from . import easyPyGui
+
+        for widget in self._widgets_by_key.values():
+            easyPyGui.gv.TABLE_WIDGETS.pop(widget.widget_uid, None)
+            easyPyGui.gv.TABLE_FRAMES.pop(widget.widget_uid, None)
+        self._widgets_by_key.clear()
+
+
+def _dumps(message):
+    return json.dumps(message, separators=(",", ":"), default=str).encode()
+
+
+def _is_index(value, count):
+    return type(value) is int and 0 <= value < count
+
+
+def _html_escape(text):
+    return (
+        str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    )
+
+
+def _encode_frame(payload, opcode=0x1):
+    """
+    Build an unmasked server-to-client WebSocket frame.
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def _unmask(payload, mask):
+    # XOR the whole payload as one integer; much faster than byte by byte.
+    length = len(payload)
+    repeated = (mask * (length // 4 + 1))[:length]
+    return (
+        int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    ).to_bytes(length, "big")
+
+
+async def _read_frame(reader):
+    """
+    Read one client message, joining fragments. Returns (opcode, payload).
+    """
+    message_opcode = None
+    chunks = []
+    while True:
+        first, second = await reader.readexactly(2)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        if length > 1 << 24:
+            raise ValueError("WebSocket frame too large")
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = _unmask(payload, mask)
+        if opcode >= 0x8:
+            return opcode, payload  # Control frames are never fragmented.
+        if message_opcode is None:
+            message_opcode = opcode
+        chunks.append(payload)
+        if first & 0x80:
+            return message_opcode, b"".join(chunks)
+
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body{font-family:sans-serif}.row{display:flex;gap:6px;margin:4px 0;align-items:flex-start}
+fieldset{margin:0}table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:2px 6px}
+tr.sel{background:#cde}
+</style></head>
+<body><div id="root"></div>
+<script>
+const ws = new WebSocket(`ws://${location.host}/ws`);
+const els = {}, kinds = {}, opts = {};
+function send(e, key, value) {
+  const v = {}; if (key !== undefined) v[key] = value;
+  ws.send(JSON.stringify({e: e, v: v}));
+}
+function make(c) {
+  const k = c.k; kinds[k] = c.t; let el;
+  switch (c.t) {
+    case "Label": el = document.createElement("span"); el.textContent = c.text ?? "";
+      el.onclick = () => send(k); break;
+    case "Button": el = document.createElement("button"); el.textContent = c.text ?? "";
+      el.onclick = () => send(k); break;
+    case "TextField": el = document.createElement("input");
+      el.oninput = () => send(k, k, el.value); break;
+    case "TextArea": el = document.createElement("textarea");
+      el.oninput = () => send(k, k, el.value); break;
+    case "CheckBox": el = document.createElement("label");
+      el.input = document.createElement("input"); el.input.type = "checkbox";
+      el.append(el.input, c.text ?? "");
+      el.input.onchange = () => send(k, k, el.input.checked); break;
+    case "Radio": el = document.createElement("div"); el.inputs = [];
+      for (const o of c.options) {
+        const l = document.createElement("label"), i = document.createElement("input");
+        i.type = "radio"; i.name = k; i.value = o; el.inputs.push(i);
+        i.onchange = () => send(k, k, o); l.append(i, o); el.append(l, document.createElement("br"));
+      } break;
+    case "Slider": el = document.createElement("input"); el.type = "range";
+      el.min = c.from; el.max = c.to; el.oninput = () => send(k, k, Number(el.value)); break;
+    case "ComboBox": el = document.createElement("select");
+      el.onchange = () => send(k, k, el.selectedIndex); break;
+    case "ListBox": el = document.createElement("select"); el.multiple = true;
+      el.onchange = () => send(k, k, [...el.selectedOptions].map(o => o.index)); break;
+    case "ProgressBar": el = document.createElement("progress"); el.max = c.max; break;
+    case "TreeView": el = document.createElement("table"); el.selected = new Set();
+      if (c.columns) {
+        const head = el.insertRow();
+        for (const n of c.columns) head.append(Object.assign(document.createElement("th"), {textContent: n}));
+        for (const r of c.rows) {
+          const tr = el.insertRow(); tr.rowId = r[0];
+          for (const x of r.slice(1)) tr.insertCell().textContent = x;
+          tr.onclick = () => send(k, k, [tr.rowId]);
+        }
+      } break;
+    case "Frame": el = document.createElement("fieldset");
+      const lg = document.createElement("legend"); lg.textContent = c.text ?? "";
+      el.append(lg); build(el, c.layout); break;
+    default: el = document.createElement("span"); el.textContent = "Unknown Widget";
+  }
+  els[k] = el; return el;
+}
+function build(parent, layout) {
+  for (const row of layout) {
+    const div = document.createElement("div"); div.className = "row";
+    for (const c of row) div.append(make(c));
+    parent.append(div);
+  }
+}
+function setOptions(k, list) {
+  const el = els[k]; if (!el) return; opts[k] = list;
+  el.replaceChildren(...list.map(o => new Option(o)));
+}
+function setValue(k, v) {
+  const el = els[k]; if (!el) return;
+  if (document.activeElement === el || document.activeElement === el.input) return;
+  switch (kinds[k]) {
+    case "TextField": case "TextArea": el.value = v ?? ""; break;
+    case "CheckBox": el.input.checked = !!v; break;
+    case "Radio": for (const i of el.inputs) i.checked = i.value === v; break;
+    case "Slider": el.value = v; break;
+    case "ComboBox": el.selectedIndex = v ?? -1; break;
+    case "ListBox": for (const o of el.options) o.selected = v.includes(o.index); break;
+    case "ProgressBar": el.value = v; break;
+    case "TreeView": for (const tr of el.rows) tr.classList.toggle("sel", v.includes(tr.rowId)); break;
+  }
+}
+ws.onmessage = (m) => {
+  const msg = JSON.parse(m.data);
+  if (msg.layout) { document.title = msg.title; build(document.getElementById("root"), msg.layout); }
+  for (const k in msg.o ?? {}) setOptions(k, msg.o[k]);
+  for (const k in msg.v ?? {}) setValue(k, msg.v[k]);
+  if ("h" in msg) document.body.style.visibility = msg.h ? "hidden" : "visible";
+};
+</script></body></html>
+"""
@@ -0,0 +1,234 @@
+import heapq
+import itertools
+from contextlib import contextmanager
+
+# Computed values currently being evaluated; reads register dependencies
+# on the innermost one.
+_tracking = []
+
+
+class Observable:
+    """
+    A value that Computed values can depend on. When bound to a widget key
+    it follows the widget's value in read_events and writes back on set.
+    """
+
+    def __init__(self, model, value=None, key=None):
+        self.model = model
+        self.key = key
+        self._value = value
+        self._dependents = set()
+        self._height = 0
+
+    def get(self):
+        if _tracking:
+            _tracking[-1]._depend_on(self)
+        return self._value
+
+    def set(self, value):
+        self._assign(value, push=True)
+
+    def _assign(self, value, push):
+        if value == self._value:
+            return
+        self._value = value
+        self.model._changed(self, push)
+
+    value = property(get, set)
+
+    def __repr__(self):
+        return f"Observable({self.key}, {self._value!r})"
+
+
+class Computed:
+    """
+    A value derived by calling 'fn'. The Observables and Computeds read
+    while 'fn' runs become its dependencies, and it is recomputed only when
+    one of them changes.
+    """
+
+    def __init__(self, model, fn, key=None):
+        self.model = model
+        self.fn = fn
+        self.key = key
+        self._value = None
+        self._dependencies = set()
+        self._dependents = set()
+        self._height = 1
+        self._computing = False
+        self._recompute()
+
+    def get(self):
+        if _tracking:
+            _tracking[-1]._depend_on(self)
+        return self._value
+
+    value = property(get)
+
+    def _depend_on(self, node):
+        if node is self:
+            raise RuntimeError(f"Computed {self.key!r} depends on itself")
+        self._dependencies.add(node)
+        node._dependents.add(self)
+
+    def _recompute(self):
+        """
+        Run 'fn' again, re-tracking its dependencies. Returns True when the
+        value changed.
+        """
+        if self._computing:
+            raise RuntimeError(f"Dependency cycle through Computed {self.key!r}")
+        for node in self._dependencies:
+            node._dependents.discard(self)
+        self._dependencies = set()
+        self._computing = True
+        _tracking.append(self)
+        try:
+            value = self.fn()
+        finally:
+            _tracking.pop()
+            self._computing = False
+        self._height = 1 + max(
+            (node._height for node in self._dependencies), default=0
+        )
+        if value == self._value:
+            return False
+        self._value = value
+        return True
+
+    def __repr__(self):
+        return f"Computed({self.key}, {self._value!r})"
+
+
+class Model:
+    """
+    Reactive values for a window. Changing an Observable re-runs only the
+    Computeds downstream of it, in dependency order, and pushes the values
+    that actually changed to their bound widgets in one batched update.
+    """
+
+    def __init__(self, window=None):
+        self.window = None
+        self._inputs = {}  # widget key -> Observable
+        self._changed_nodes = []
+        self._transaction_depth = 0
+        self._seq = itertools.count()
+        if window is not None:
+            self.attach(window)
+
+    def attach(self, window):
+        """
+        Connect the model to 'window': bound Observables follow the values
+        from read_events and bound values are written to the widgets.
+        """
+        self.window = window
+        window._models.append(self)
+
+    def value(self, value=None, key=None):
+        """
+        Create an Observable. With a 'key' it is bound to that widget and,
+        when no initial 'value' is given, starts from the widget's value.
+        """
+        if key is not None and value is None and self.window is not None:
+            value = self.window._value_of(key)
+        elif key is not None and value is not None:
+            self._restore({key: value})
+        observable = Observable(self, value, key)
+        if key is not None:
+            self._inputs[key] = observable
+        return observable
+
+    def computed(self, fn, key=None):
+        """
+        Create a Computed from 'fn'. With a 'key' its value is shown in
+        that widget and kept up to date.
+        """
+        computed = Computed(self, fn, key)
+        if key is not None:
+            self._push({key: computed._value})
+        return computed
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several set() calls into a single recompute.
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth and self._changed_nodes:
+                self._propagate()
+
+    def sync(self, values):
+        """
+        Feed a read_events values dict into the bound Observables.
+        Unchanged values cost a comparison only, and values that came from
+        the widgets are not written back to them.
+        """
+        with self.transaction():
+            for key, observable in self._inputs.items():
+                if key in values:
+                    observable._assign(values[key], push=False)
+
+    def _changed(self, observable, push):
+        self._changed_nodes.append((observable, push))
+        if not self._transaction_depth:
+            self._propagate()
+
+    def _propagate(self):
+        changed, self._changed_nodes = self._changed_nodes, []
+        inputs = {}
+        updates = {}
+        heap = []
+        queued = set()  # Nodes waiting in the heap
+
+        def schedule(node):
+            for dependent in node._dependents:
+                # Keep heights consistent when dependencies were re-tracked.
+                dependent._height = max(dependent._height, node._height + 1)
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(
+                        heap, (dependent._height, next(self._seq), dependent)
+                    )
+
+        for observable, push in changed:
+            if push and observable.key is not None:
+                inputs[observable.key] = observable._value
+            schedule(observable)
+        # Lower heights first, so a Computed normally runs once, after all
+        # of its changed dependencies are up to date. One that picks up a
+        # deeper dependency while running is queued again if that
+        # dependency changes afterwards.
+        while heap:
+            height, _, node = heapq.heappop(heap)
+            if height < node._height:
+                # Its height went up while it waited; run it later.
+                heapq.heappush(heap, (node._height, next(self._seq), node))
+                continue
+            queued.discard(node)
+            if node._recompute():
+                if node.key is not None:
+                    updates[node.key] = node._value
+                schedule(node)
+        if inputs:
+            self._restore(inputs)
+        if updates:
+            self._push(updates)
+
+    def _push(self, updates):
+        if self.window is not None:
+            self.window.update_many(updates)
+
+    def _restore(self, values):
+        """
+        Write bound inputs in the form read_events reports them, e.g. a
+        ListBox selection rather than its items.
+        """
+        if self.window is not None:
+            with self.window.batch():
+                for key, value in values.items():
+                    self.window._restore_value(key, value)
+
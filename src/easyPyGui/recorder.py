@@ -0,0 +1,114 @@
+import json
+import time
+
+
+class EventRecorder:
+    """
+    Append the events returned by Window.read_events to a file, one JSON
+    line per event: [seconds since recording started, event, changes].
+    'changes' holds only the values that differ from the previous line, so
+    the first line of a recording carries the full snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._start = time.monotonic()
+        self._last_values = {}
+
+    def write(self, event, values):
+        changes = {
+            key: value
+            for key, value in values.items()
+            if key not in self._last_values or self._last_values[key] != value
+        }
+        self._last_values = dict(values)
+        record = [round(time.monotonic() - self._start, 3), event, changes]
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        # Flush per event so a recording survives the crash it documents.
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def read_recording(path):
+    """
+    Yield (timestamp, event, changes) tuples from a recording file.
+    """
+    with open(path, encoding="utf-8") as recording:
+        for line in recording:
+            if line.strip():
+                timestamp, event, changes = json.loads(line)
+                yield timestamp, event, changes
+
+
+class EventReplay:
+    """
+    Feed a recording back into a window. Each read_events call stages the
+    next event: its recorded values are written to the widgets and the
+    event goes through Window._handle_event, as a user action would.
+    With a 'speed' the original pacing is kept (1 is real time); with
+    speed None events are staged as fast as the loop reads them.
+    """
+
+    def __init__(self, window, path, speed=1.0):
+        self.window = window
+        self.speed = speed
+        self.events = 0  # Events staged so far
+        self.started = time.monotonic()
+        self.finished = None
+        self._records = read_recording(path)
+        self._next = next(self._records, None)
+        self._last_timestamp = self._next[0] if self._next else 0
+        self._last_staged = self.started
+        self._waiting = False
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self):
+        """
+        Events per second handled so far.
+        """
+        elapsed = self.elapsed
+        return self.events / elapsed if elapsed else 0.0
+
+    def pump(self):
+        """
+        Stage the next event if it is due, or arm a timer for it.
+        Called by read_events before it looks for events.
+        """
+        if self._waiting or self.finished is not None:
+            return
+        if self.window.last_event is not None:
+            return  # The previous event has not been read yet.
+        if self._next is None:
+            self.finished = time.monotonic()
+            self.window._queue_event("--ReplayEnd--")
+            return
+        delay = 0
+        if self.speed:
+            # Timestamps restart at each recording session; a step back in
+            # time starts the next session without a pause.
+            gap = max(0, self._next[0] - self._last_timestamp) / self.speed
+            delay = self._last_staged + gap - time.monotonic()
+        if delay > 0:
+            self._waiting = True
+            self.window.after(delay, self._stage, name="--Replay--")
+        else:
+            self._stage()
+
+    def _stage(self):
+        self._waiting = False
+        timestamp, event, changes = self._next
+        for key, value in changes.items():
+            self.window._restore_value(key, value)
+        self.window._handle_event(event)
+        self.events += 1
+        self._last_timestamp = timestamp
+        self._last_staged = time.monotonic()
+        self._next = next(self._records, None)
@@ -0,0 +1,70 @@
+import json
+import os
+
+
+class StateLog:
+    """
+    Widget values persisted as an append-only log of per-key changes, one
+    JSON object per line. Reading the log folds the lines into the latest
+    values. Once more entries have been appended than the state holds
+    (and at least 'compact_min'), the log is rewritten as a single line,
+    so appending stays cheap and the file stays bounded.
+    """
+
+    def __init__(self, path, compact_min=1000):
+        self.path = path
+        self.compact_min = compact_min
+        self.state = {}
+        self._file = None
+        self._entries = 0  # Entries written since the last compaction
+
+    def load(self):
+        """
+        Read the log into 'state' and return a copy of it. A missing file
+        is an empty state; a torn last line from a crash is ignored.
+        """
+        self.state = {}
+        self._entries = 0
+        try:
+            with open(self.path, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        changes = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.state.update(changes)
+                    self._entries += len(changes)
+        except FileNotFoundError:
+            pass
+        return dict(self.state)
+
+    def append(self, changes):
+        if not changes:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(changes, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        self._file.flush()
+        self.state.update(changes)
+        self._entries += len(changes)
+        if self._entries > max(self.compact_min, len(self.state)):
+            self.compact()
+
+    def compact(self):
+        """
+        Rewrite the log as one line holding the full state. The new file
+        replaces the old one atomically.
+        """
+        self.close()
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as log:
+            log.write(json.dumps(self.state, separators=(",", ":"), default=str))
+            log.write("\n")
+        os.replace(temp_path, self.path)
+        self._entries = len(self.state)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
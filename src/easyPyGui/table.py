@@ -0,0 +1,100 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain lists are used without it.
+    np = None
+
+
+class ColumnStore:
+    """
+    Column-oriented rows for a table-mode TreeView. Each column is kept as
+    one array (NumPy when available), rows are identified by their stable
+    index, and the display order is derived from cached sort orders and a
+    boolean filter mask.
+    """
+
+    def __init__(self, columns):
+        self.names = list(columns)
+        self.columns = {name: self._array(columns[name]) for name in self.names}
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All table columns must have the same length")
+        self.length = lengths.pop() if lengths else 0
+        self.iids = [str(row_id) for row_id in range(self.length)]
+        self.sort_column = None
+        self.descending = False
+        self.mask = None
+        self._sort_cache = {}
+
+    @staticmethod
+    def _array(values):
+        if np is not None:
+            return np.asarray(values)
+        return list(values)
+
+    def __len__(self):
+        return self.length
+
+    def row(self, row_id):
+        """
+        Return the values of one row, in column order.
+        """
+        return tuple(self.columns[name][row_id] for name in self.names)
+
+    def argsort(self, name, descending=False):
+        """
+        Row ids ordered by column 'name', computed once per column and
+        direction. Rows with equal values keep their insertion order in
+        both directions.
+        """
+        order = self._sort_cache.get((name, descending))
+        if order is None:
+            values = self.columns[name]
+            if np is None:
+                order = sorted(
+                    range(self.length), key=values.__getitem__, reverse=descending
+                )
+            elif descending:
+                # Sort the reversed column and map back, so ties stay in
+                # insertion order once the result is reversed.
+                order = self.length - 1 - np.argsort(values[::-1], kind="stable")
+                order = order[::-1]
+            else:
+                order = np.argsort(values, kind="stable")
+            self._sort_cache[(name, descending)] = order
+        return order
+
+    def set_sort(self, name, descending=False):
+        if name is not None and name not in self.columns:
+            raise KeyError(f"No column {name!r}")
+        self.sort_column = name
+        self.descending = descending
+
+    def set_filter(self, mask):
+        """
+        Show only the rows where 'mask' is true. 'mask' is a boolean
+        sequence with one entry per row, or a callable receiving the
+        {name: column} dict and returning one; None shows every row.
+        """
+        if callable(mask):
+            mask = mask(self.columns)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool) if np is not None else list(mask)
+            if len(mask) != self.length:
+                raise ValueError("Filter mask length does not match the table")
+        self.mask = mask
+
+    def view(self):
+        """
+        Row ids of the visible rows, in display order.
+        """
+        if self.sort_column is None:
+            order = np.arange(self.length) if np is not None else range(self.length)
+        else:
+            order = self.argsort(self.sort_column, self.descending)
+        if self.mask is not None:
+            if np is not None:
+                order = order[self.mask[order]]
+            else:
+                mask = self.mask
+                order = [row_id for row_id in order if mask[row_id]]
+        return order
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+
+def _display_available():
+    try:
+        import tkinter
+
+        tkinter.Tk().destroy()
+    except Exception:  # No tkinter, or no display to connect to.
+        return False
+    return True
+
+
+@pytest.fixture(scope="session")
+def display():
+    if not _display_available():
+        pytest.skip("needs a display")
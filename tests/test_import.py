@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import easyPyGui
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def test_import_is_lazy_and_fast(tmp_path):
+    # A fresh interpreter, so nothing imported by the test run leaks in.
+    env = dict(os.environ, PYTHONPATH=SRC)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+    modules = set(result["modules"])
+    assert "tkinter" not in modules
+    assert "numpy" not in modules
+    assert "config" not in modules
+    assert result["elapsed"] < 0.05
@@ -0,0 +1,64 @@
+import gc
+import tracemalloc
+
+import easyPyGui as es
+from easyPyGui import easyPyGui as core
+
+
+def _open_and_close():
+    layout = [
+        [es.Label("name", key="l"), es.TextField("", key="t")],
+        [es.Frame("F", key="f", layout=[[es.CheckBox("c", key="c")]])],
+    ]
+    es.Window("child", layout=layout).unload()
+
+
+def _tcl_commands(window):
+    return len(window.root.tk.call("info", "commands"))
+
+
+def test_open_close_cycles_do_not_leak(display):
+    root = es.Window("root", layout=[[es.Label("root", key="root")]])
+    try:
+        for _ in range(100):  # Warm up caches and interned strings.
+            _open_and_close()
+        gc.collect()
+        commands = _tcl_commands(root)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for _ in range(10_000):
+            _open_and_close()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        assert growth < 1_000_000
+        # Leaked Tcl commands and widgets live outside the Python heap.
+        assert _tcl_commands(root) - commands < 100
+    finally:
+        root.unload()
+    gc.collect()
+    assert not core.gv.TABLE_WINDOWS
+    assert not core.gv.TABLE_WIDGETS
+    assert not core.gv.TABLE_FRAMES
+
+
+def test_closing_a_window_nobody_reads_unloads_it(display):
+    root = es.Window("root", layout=[[es.Label("root", key="root")]])
+    try:
+        child = es.Window("child", layout=[[es.TextField("", key="t")]])
+        child._on_exit()  # The close button, while only root is read.
+        root.read_events(seconds=0)
+        assert child._unloaded
+        assert "t" not in root.read_events(seconds=0)[1]
+    finally:
+        root.unload()
+
+
+def test_closing_the_read_window_reports_exit(display):
+    window = es.Window("main", layout=[[es.TextField("", key="t")]])
+    window.Update("t", "last")
+    window.after(0, window._on_exit)
+    event, values = window.read_events(seconds=1)
+    assert (event, values["t"]) == ("--Exit--", "last")
+    assert window._unloaded
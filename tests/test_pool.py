@@ -0,0 +1,39 @@
+import easyPyGui as es
+
+
+def _row():
+    return [
+        es.Button("b", key="button"),
+        es.CheckBox("c", key="check"),
+        es.Slider(0, 10, key="slider"),
+        es.TreeView(key="table", data={"n": [1, 2]}),
+    ]
+
+
+def _churn(window):
+    window.insert_row(_row())
+    for key in ("button", "check", "slider", "table"):
+        window.remove(key)
+
+
+def test_pooled_widgets_do_not_leak_tcl_commands(display):
+    window = es.Window("pool", layout=[[es.Label("top", key="top")]])
+    try:
+        _churn(window)  # Fill the pool.
+        before = len(window.root.tk.call("info", "commands"))
+        for _ in range(200):
+            _churn(window)
+        assert len(window.root.tk.call("info", "commands")) == before
+    finally:
+        window.unload()
+
+
+def test_pooled_button_reports_its_new_key(display):
+    window = es.Window("pool", layout=[[es.Button("old", key="old")]])
+    try:
+        window.remove("old")
+        window.insert_row([es.Button("new", key="new")])
+        window._widgets_by_key["new"].root.invoke()
+        assert window.read_events(seconds=0)[0] == "new"
+    finally:
+        window.unload()
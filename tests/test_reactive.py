@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+
+import pytest
+
+from easyPyGui.reactive import Model
+
+
+class RecordingWindow:
+    """Stands in for a Window, recording what the model writes."""
+
+    def __init__(self):
+        self._models = []
+        self._widgets_by_key = {}
+        self.updates = []
+        self.restored = []
+
+    def _value_of(self, key):
+        return None
+
+    def update_many(self, updates):
+        self.updates.append(dict(updates))
+
+    def _restore_value(self, key, value):
+        self.restored.append((key, value))
+
+    @contextmanager
+    def batch(self):
+        yield
+
+
+def test_computed_recomputes_only_downstream():
+    model = Model()
+    a, b = model.value(1), model.value(10)
+    calls = []
+    total = model.computed(lambda: calls.append("total") or a.get() + b.get())
+    double = model.computed(lambda: calls.append("double") or a.get() * 2)
+    calls.clear()
+    b.set(20)
+    assert (total.value, double.value) == (21, 2)
+    assert calls == ["total"]
+
+
+def test_transaction_runs_each_computed_once():
+    model = Model()
+    a, b = model.value(1), model.value(2)
+    calls = []
+    total = model.computed(lambda: calls.append(1) or a.get() + b.get())
+    calls.clear()
+    with model.transaction():
+        a.set(5)
+        b.set(6)
+    assert total.value == 11
+    assert len(calls) == 1
+
+
+def test_computed_gaining_a_deeper_dependency_is_not_stale():
+    model = Model()
+    p, switch = model.value(1), model.value(False)
+    q1 = model.computed(lambda: p.get() + 1)
+    q2 = model.computed(lambda: q1.get() + 1)
+    q3 = model.computed(lambda: q2.get() + 1)
+    r = model.computed(lambda: q3.get() if switch.get() else -1)
+    with model.transaction():
+        switch.set(True)
+        p.set(2)
+    assert q3.value == 5
+    assert r.value == 5
+
+
+def test_self_dependency_is_reported():
+    model = Model()
+    a = model.value(1)
+    nodes = []
+    nodes.append(model.computed(lambda: a.get() + sum(n.get() for n in nodes)))
+    with pytest.raises(RuntimeError):
+        a.set(2)
+
+
+def test_bound_values_are_written_in_their_own_forms():
+    window = RecordingWindow()
+    model = Model(window)
+    selection = model.value((0,), key="list")
+    model.computed(lambda: [f"item {i}" for i in selection.get()], key="items")
+    window.updates.clear()
+    window.restored.clear()
+
+    selection.set((1,))
+    assert window.restored == [("list", (1,))]
+    assert window.updates == [{"items": ["item 1"]}]
+
+
+def test_sync_does_not_write_widget_values_back():
+    window = RecordingWindow()
+    model = Model(window)
+    field = model.value(key="field")
+    shout = model.computed(lambda: (field.get() or "").upper(), key="shout")
+    window.updates.clear()
+    window.restored.clear()
+
+    model.sync({"field": "hi", "other": 1})
+    assert field.value == "hi"
+    assert shout.value == "HI"
+    assert window.restored == []
+    assert window.updates == [{"shout": "HI"}]
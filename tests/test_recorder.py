@@ -0,0 +1,38 @@
+import easyPyGui as es
+from easyPyGui.recorder import EventRecorder, read_recording
+
+
+def test_changes_are_diffed_against_a_copy(tmp_path):
+    path = tmp_path / "events.jsonl"
+    recorder = EventRecorder(path)
+    values = {"a": 1, "b": "x"}
+    recorder.write("first", values)
+    values["a"] = 2  # The application changing the dict it was given.
+    recorder.write("second", {"a": 2, "b": "x"})
+    recorder.close()
+    records = [(event, changes) for _, event, changes in read_recording(path)]
+    assert records == [("first", {"a": 1, "b": "x"}), ("second", {"a": 2})]
+
+
+def test_replay_stages_recorded_values(display, tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        '[0.0,"go",{"progress":40.0,"combo":null,"slider":30.0,"field":"hi"}]\n'
+    )
+    layout = [
+        [es.ProgressBar(key="progress"), es.ComboBox(["x", "y"], key="combo")],
+        [es.Slider(0, 100, key="slider"), es.TextField("", key="field")],
+        [es.Button("go", key="go")],
+    ]
+    window = es.Window("replayed", layout=layout)
+    try:
+        window.replay(path, speed=None)
+        event, values = window.read_events(seconds=1)
+        assert event == "go"
+        assert values["progress"] == 40.0
+        assert values["combo"] is None
+        assert window._widgets_by_key["combo"].root.get() == ""
+        assert (values["slider"], values["field"]) == (30.0, "hi")
+        assert window.read_events(seconds=1)[0] == "--ReplayEnd--"
+    finally:
+        window.unload()
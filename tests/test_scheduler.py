@@ -0,0 +1,102 @@
+import pytest
+
+from easyPyGui import easyPyGui as core
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeRoot:
+    """Stands in for the Tk root, keeping the armed 'after' calls."""
+
+    def __init__(self):
+        self.pending = {}
+        self._ids = 0
+
+    def after(self, ms, func):
+        self._ids += 1
+        self.pending[self._ids] = (ms, func)
+        return self._ids
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self):
+        (after_id, (ms, func)), = self.pending.items()
+        del self.pending[after_id]
+        func()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(core, "time", clock)
+    return clock
+
+
+def test_one_after_for_the_earliest_deadline(clock):
+    root = FakeRoot()
+    scheduler = core._Scheduler(root)
+    scheduler.add("slow", 5, lambda: None, repeat=False)
+    scheduler.add("fast", 0.25, lambda: None, repeat=False)
+    scheduler.add("mid", 1, lambda: None, repeat=True)
+    assert [ms for ms, func in root.pending.values()] == [250]
+
+
+def test_repeating_timer_does_not_drift_and_skips_missed_ticks(clock):
+    root = FakeRoot()
+    scheduler = core._Scheduler(root)
+    ticks = []
+    scheduler.add("tick", 1, lambda: ticks.append(clock.now), repeat=True)
+
+    clock.now = 101.02  # Fired a little late.
+    root.fire()
+    assert scheduler.timers["tick"].deadline == 102.0
+
+    clock.now = 105.5  # The loop was busy for several periods.
+    root.fire()
+    assert ticks == [101.02, 105.5]
+    assert scheduler.timers["tick"].deadline == 106.0
+
+
+def test_raising_callback_does_not_lose_other_timers(clock):
+    root = FakeRoot()
+    scheduler = core._Scheduler(root)
+    ran = []
+
+    def fail():
+        raise ValueError("boom")
+
+    scheduler.add("a", 1, fail, repeat=False)
+    scheduler.add("b", 1, lambda: ran.append("b"), repeat=False)
+    scheduler.add("later", 2, lambda: ran.append("later"), repeat=False)
+    clock.now = 101
+    with pytest.raises(ValueError):
+        root.fire()
+    assert ran == ["b"]
+    clock.now = 102
+    root.fire()
+    assert ran == ["b", "later"]
+
+
+def test_rearming_a_timer_keeps_the_heap_bounded(clock):
+    root = FakeRoot()
+    scheduler = core._Scheduler(root)
+    scheduler.add("soon", 1, lambda: None, repeat=True)  # Heads the heap.
+    for _ in range(1000):
+        scheduler.add("debounce", 30, lambda: None, repeat=False)
+    assert len(scheduler._heap) <= 4
+    assert set(scheduler.timers) == {"soon", "debounce"}
+
+
+def test_stop_cancels_everything(clock):
+    root = FakeRoot()
+    scheduler = core._Scheduler(root)
+    scheduler.add("a", 1, lambda: None, repeat=True)
+    scheduler.stop()
+    assert not root.pending and not scheduler.timers
@@ -0,0 +1,46 @@
+import easyPyGui as es
+
+
+def _layout():
+    return [
+        [es.Label("label", key="label"), es.Button("button", key="button")],
+        [es.TextField("", key="field"), es.TextArea("", key="area")],
+        [es.CheckBox("check", key="check"), es.RadioButton(["a", "b"], key="radio")],
+        [es.Slider(0, 100, key="slider"), es.ProgressBar(key="progress")],
+        [es.ComboBox(["x", "y"], key="combo"), es.ComboBox(["x", "y"], key="unset")],
+        [es.ListBox(["p", "q", "r"], key="list")],
+        [es.TreeView(key="table", data={"n": [3, 1, 2]})],
+        [es.Frame("F", key="frame", layout=[[es.TextField("", key="inner")]])],
+    ]
+
+
+def test_save_restore_round_trip(display, tmp_path):
+    path = tmp_path / "state.log"
+    window = es.Window("saved", layout=_layout())
+    try:
+        window.update_many(
+            {
+                "field": "text",
+                "area": "lines",
+                "check": True,
+                "radio": "b",
+                "slider": 40,
+                "progress": 75,
+                "combo": 1,
+                "inner": "nested",
+            }
+        )
+        window._restore_value("list", [0, 2])
+        window._restore_value("table", [1])
+        saved = window.read_events(seconds=0)[1]
+        window.save_state(path)
+    finally:
+        window.unload()
+
+    window = es.Window("restored", layout=_layout())
+    try:
+        window.restore_state(path)
+        assert window.read_events(seconds=0)[1] == saved
+        assert window._widgets_by_key["unset"].root.get() == ""
+    finally:
+        window.unload()
@@ -0,0 +1,74 @@
+import importlib.util
+
+import pytest
+
+from easyPyGui import table
+from easyPyGui.table import ColumnStore
+
+BACKENDS = ["lists"]
+if importlib.util.find_spec("numpy") is not None:
+    BACKENDS.append("numpy")
+
+
+@pytest.fixture(params=BACKENDS, autouse=True)
+def backend(request, monkeypatch):
+    if request.param == "lists":
+        monkeypatch.setattr(table, "np", None)
+    else:
+        import numpy
+
+        monkeypatch.setattr(table, "np", numpy)
+    return request.param
+
+
+def _store():
+    return ColumnStore({"name": ["b", "a", "c", "a"], "size": [2, 1, 2, 3]})
+
+
+def test_rows_in_insertion_order():
+    store = _store()
+    assert len(store) == 4
+    assert list(store.view()) == [0, 1, 2, 3]
+    assert store.row(2) == ("c", 2)
+
+
+def test_sort_is_stable_in_both_directions():
+    store = _store()
+    store.set_sort("size")
+    assert list(store.view()) == [1, 0, 2, 3]
+    store.set_sort("size", descending=True)
+    assert list(store.view()) == [3, 0, 2, 1]
+    store.set_sort("name", descending=True)
+    assert list(store.view()) == [2, 0, 1, 3]
+
+
+def test_unknown_sort_column():
+    with pytest.raises(KeyError):
+        _store().set_sort("missing")
+
+
+def test_filter_mask_and_callable():
+    store = _store()
+    store.set_sort("size", descending=True)
+    store.set_filter([True, False, True, True])
+    assert list(store.view()) == [3, 0, 2]
+    store.set_filter(lambda columns: [name == "a" for name in columns["name"]])
+    assert list(store.view()) == [3, 1]
+    store.set_filter(None)
+    assert list(store.view()) == [3, 0, 2, 1]
+
+
+def test_mask_length_must_match():
+    with pytest.raises(ValueError):
+        _store().set_filter([True, False])
+
+
+def test_columns_must_have_the_same_length():
+    with pytest.raises(ValueError):
+        ColumnStore({"a": [1, 2], "b": [1]})
+
+
+def test_list_backend_keeps_plain_lists(backend):
+    store = _store()
+    if backend == "lists":
+        assert store.columns["size"] == [2, 1, 2, 3]
@@ -0,0 +1,111 @@
+import base64
+import json
+import os
+import socket
+import struct
+
+import easyPyGui as es
+from easyPyGui.reactive import Model
+from easyPyGui.easyPyGuiWeb import Window
+
+
+class Client:
+    """A minimal WebSocket client over a raw socket."""
+
+    def __init__(self, address, origin=None, host=None):
+        self.sock = socket.create_connection(address, timeout=5)
+        key = base64.b64encode(os.urandom(16)).decode()
+        host = host or f"{address[0]}:{address[1]}"
+        request = f"GET /ws HTTP/1.1\r\nHost: {host}\r\n"
+        request += "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+        request += f"Sec-WebSocket-Key: {key}\r\n"
+        if origin:
+            request += f"Origin: {origin}\r\n"
+        self.sock.sendall((request + "\r\n").encode())
+        self.file = self.sock.makefile("rb")
+        self.status = self.file.readline()
+        while self.file.readline() != b"\r\n":
+            pass
+
+    def recv(self):
+        header = self.file.read(2)
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.file.read(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.file.read(8))[0]
+        return json.loads(self.file.read(length))
+
+    def send(self, message):
+        payload = json.dumps(message).encode()
+        mask = os.urandom(4)
+        header = bytes([0x81, 0x80 | len(payload)])  # Test messages stay short.
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(header + mask + masked)
+
+
+def test_snapshot_deltas_and_timers():
+    layout = [[es.TextField("x", key="t"), es.CheckBox("c", key="cb")]]
+    window = Window("app", layout=layout, port=0)
+    try:
+        first, second = Client(window.address), Client(window.address)
+        assert first.recv()["v"] == {"t": "x", "cb": False}
+        second.recv()
+
+        first.send({"e": "t", "v": {"t": "hello"}})
+        event, values = window.read_events(seconds=2)
+        assert (event, values["t"]) == ("t", "hello")
+        assert second.recv() == {"v": {"t": "hello"}}
+
+        with window.batch():
+            window.Update("t", "a")
+            window.Update("t", "b")
+            window.Update("cb", True)
+        assert second.recv() == {"v": {"t": "b", "cb": True}}
+
+        window.after(0.05, name="tick")
+        assert window.read_events(seconds=2)[0] == "--Timer:tick--"
+    finally:
+        window.unload()
+
+
+def test_foreign_origin_and_bad_messages_are_rejected():
+    window = Window("app", layout=[[es.ListBox(["a"], key="lb")]], port=0)
+    try:
+        port = window.address[1]
+        assert b"403" in Client(window.address, "http://evil.example").status
+        # DNS rebinding: the attacker's name resolves to this server.
+        rebound = f"attacker.example:{port}"
+        assert b"403" in Client(window.address, f"http://{rebound}", rebound).status
+        local = f"localhost:{port}"
+        assert b"101" in Client(window.address, f"http://{local}", local).status
+        client = Client(window.address, window.url.rstrip("/"))
+        assert b"101" in client.status
+        client.recv()
+        for message in ([1, 2], {"v": {"lb": 3}}, {"v": {"lb": [5]}}, {"e": [1]}):
+            client.send(message)
+        client.send({"e": "lb", "v": {"lb": [0]}})
+        assert window.read_events(seconds=2) == ("lb", {"lb": (0,)})
+    finally:
+        window.unload()
+
+
+def test_model_on_web_window():
+    layout = [[es.ListBox(["a", "b"], key="lb"), es.Label("", key="shown")]]
+    window = Window("app", layout=layout, port=0)
+    try:
+        client = Client(window.address)
+        client.recv()
+        model = Model(window)
+        selection = model.value(key="lb")
+        model.computed(lambda: ",".join(map(str, selection.get())), key="shown")
+        selection.set((1,))
+        assert client.recv() == {"v": {"lb": [1], "shown": "1"}}
+        assert window.get("lb") == (1,)
+
+        client.send({"e": "lb", "v": {"lb": [0]}})
+        event, values = window.read_events(seconds=2)
+        assert (event, selection.value) == ("lb", (0,))
+        assert client.recv()["v"]["shown"] == "0"
+    finally:
+        window.unload()